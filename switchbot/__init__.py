@@ -95,7 +95,6 @@ __all__ = [
     "StripLightColorMode",
     "SwitchBotAdvertisement",
     "Switchbot",
-    "Switchbot",
     "SwitchbotAccountConnectionError",
     "SwitchbotAirPurifier",
     "SwitchbotApiError",
@@ -118,11 +117,9 @@ __all__ = [
     "SwitchbotLock",
     "SwitchbotMeterProCO2",
     "SwitchbotModel",
-    "SwitchbotModel",
     "SwitchbotOperationError",
     "SwitchbotPermanentOutdoorLight",
     "SwitchbotPlugMini",
-    "SwitchbotPlugMini",
     "SwitchbotRelaySwitch",
     "SwitchbotRelaySwitch2PM",
     "SwitchbotRgbicLight",
@@ -133,7 +130,6 @@ __all__ = [
     "SwitchbotStandingFan",
     "SwitchbotStripLight3",
     "SwitchbotSupportedType",
-    "SwitchbotSupportedType",
     "SwitchbotVacuum",
     "VerticalOscillationAngle",
     "close_stale_connections",
@@ -3,16 +3,21 @@
 from __future__ import annotations
 
 import logging
+import struct
 from datetime import timedelta
 
 from ..const.evaporative_humidifier import (
+    HUMIDIFIER_MODES_BY_VALUE,
+    WATER_LEVEL_NAMES,
     HumidifierMode,
-    HumidifierWaterLevel,
 )
 from ..helpers import celsius_to_fahrenheit
 
 _LOGGER = logging.getLogger(__name__)
 
+# seq, status, alerts, meter, water level, filter run time, target humidity
+_EVAPORATIVE_HUMIDIFIER_STRUCT = struct.Struct(">BBBBxBHxxB")
+
 # mfr_data: 943cc68d3d2e
 # data: 650000cd802b6300
 # data: 650000cd802b6300
@@ -67,25 +72,27 @@ def process_evaporative_humidifier(
     if mfr_data is None or len(mfr_data) < 17:
         return {}
 
-    seq_number = mfr_data[6]
-    is_on = bool(mfr_data[7] & 0b10000000)
-    mode = HumidifierMode(mfr_data[7] & 0b00001111)
-    over_humidify_protection = bool(mfr_data[8] & 0b10000000)
-    child_lock = bool(mfr_data[8] & 0b00100000)
-    tank_removed = bool(mfr_data[8] & 0b00000100)
-    tilted_alert = bool(mfr_data[8] & 0b00000010)
-    filter_missing = bool(mfr_data[8] & 0b00000001)
-    is_meter_binded = bool(mfr_data[9] & 0b10000000)
+    seq_number, status, alerts, meter, level, run_time, target = (
+        _EVAPORATIVE_HUMIDIFIER_STRUCT.unpack_from(mfr_data, 6)
+    )
+    is_on = bool(status & 0b10000000)
+    mode_value = status & 0b00001111
+    # Unknown values fall through to the enum, which raises ValueError.
+    mode = HUMIDIFIER_MODES_BY_VALUE.get(mode_value) or HumidifierMode(mode_value)
+    over_humidify_protection = bool(alerts & 0b10000000)
+    child_lock = bool(alerts & 0b00100000)
+    tank_removed = bool(alerts & 0b00000100)
+    tilted_alert = bool(alerts & 0b00000010)
+    filter_missing = bool(alerts & 0b00000001)
+    is_meter_binded = bool(meter & 0b10000000)
 
     _temp_c, _temp_f, humidity = calculate_temperature_and_humidity(
         mfr_data[9:12], is_meter_binded
     )
 
-    water_level = HumidifierWaterLevel(mfr_data[11] & 0b00000011).name.lower()
-    filter_run_time = timedelta(
-        hours=int.from_bytes(mfr_data[12:14], byteorder="big") & 0xFFF
-    )
-    target_humidity = mfr_data[16] & 0b01111111
+    water_level = WATER_LEVEL_NAMES[level & 0b00000011]
+    filter_run_time = timedelta(hours=run_time & 0xFFF)
+    target_humidity = target & 0b01111111
 
     return {
         "seq_number": seq_number,
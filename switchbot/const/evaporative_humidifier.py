@@ -46,3 +46,9 @@ TARGET_HUMIDITY_MODES = {
     HumidifierMode.SLEEP,
     HumidifierMode.TARGET_HUMIDITY,
 }
+
+# Decode tables for the packed mode and water level bits; plain dict lookups
+# skip the Enum call machinery on every advertisement.
+HUMIDIFIER_MODES_BY_VALUE = {mode.value: mode for mode in HumidifierMode}
+
+WATER_LEVEL_NAMES = {level.value: level.name.lower() for level in HumidifierWaterLevel}
@@ -1,20 +1,33 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from abc import abstractmethod
+from functools import lru_cache
 from typing import Any
 
-from ..helpers import create_background_task
+from ..helpers import HEX_BYTE, create_background_task
 from ..models import SwitchBotAdvertisement
-from .device import SwitchbotDevice, SwitchbotOperationError, update_after_operation
+from .device import (
+    COMMAND_SUCCESS,
+    SwitchbotDevice,
+    SwitchbotOperationError,
+    update_after_operation,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=8)
+def _rgb_command(template: str, brightness: int, r: int, g: int, b: int) -> bytes:
+    """Build a set_rgb command; repeated frames of a transition reuse it."""
+    return bytes.fromhex(template.format("")) + bytes((brightness, r, g, b))
+
+
 class SwitchbotBaseLight(SwitchbotDevice):
     """Representation of a Switchbot light."""
 
-    _effect_dict: dict[str, list[str]] = {}
+    _effect_dict: dict[str, list[str]] | dict[str, list[bytes]] = {}
     _set_brightness_command: str = ""
     _set_color_temp_command: str = ""
     _set_rgb_command: str = ""
@@ -98,22 +111,26 @@ class SwitchbotBaseLight(SwitchbotDevice):
     async def set_brightness(self, brightness: int) -> bool:
         """Set brightness."""
         self._validate_brightness(brightness)
-        hex_brightness = f"{brightness:02X}"
+        hex_brightness = HEX_BYTE[brightness]
         self._check_function_support(self._set_brightness_command)
         result = await self._send_command(
             self._set_brightness_command.format(hex_brightness)
         )
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def set_color_temp(self, brightness: int, color_temp: int) -> bool:
         """Set color temp."""
         self._validate_brightness(brightness)
         self._validate_color_temp(color_temp)
-        hex_data = f"{brightness:02X}{color_temp:04X}"
+        hex_data = (
+            HEX_BYTE[brightness]
+            + HEX_BYTE[color_temp >> 8]
+            + HEX_BYTE[color_temp & 0xFF]
+        )
         self._check_function_support(self._set_color_temp_command)
         result = await self._send_command(self._set_color_temp_command.format(hex_data))
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def set_rgb(self, brightness: int, r: int, g: int, b: int) -> bool:
@@ -121,14 +138,17 @@ class SwitchbotBaseLight(SwitchbotDevice):
         self._validate_brightness(brightness)
         self._validate_rgb(r, g, b)
         self._check_function_support(self._set_rgb_command)
-        hex_data = f"{brightness:02X}{r:02X}{g:02X}{b:02X}"
-        result = await self._send_command(self._set_rgb_command.format(hex_data))
-        return self._check_command_result(result, 0, {1})
+        result = await self._send_command(
+            _rgb_command(self._set_rgb_command, brightness, r, g, b)
+        )
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def set_effect(self, effect: str) -> bool:
         """Set effect."""
-        effect_template = self._effect_dict.get(effect.lower())
+        effect_template = self._effect_dict.get(effect) or self._effect_dict.get(
+            effect.lower()
+        )
         if not effect_template:
             raise SwitchbotOperationError(f"Effect {effect} not supported")
         result = await self._send_multiple_commands(effect_template)
@@ -137,29 +157,30 @@ class SwitchbotBaseLight(SwitchbotDevice):
         return result
 
     async def _get_multi_commands_results(
-        self, commands: list[str]
+        self, commands: list[str] | list[bytes]
     ) -> tuple[bytes, bytes] | None:
         """Check results after sending multiple commands."""
         if not (results := await self._get_basic_info_by_multi_commands(commands)):
             return None
 
         _version_info, _data = results[0], results[1]
-        _LOGGER.debug(
-            "version info: %s, data: %s, address: %s",
-            _version_info,
-            _data,
-            self._device.address,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "version info: %s, data: %s, address: %s",
+                _version_info,
+                _data,
+                self._device.address,
+            )
         return _version_info, _data
 
     async def _get_basic_info_by_multi_commands(
-        self, commands: list[str]
+        self, commands: list[str] | list[bytes]
     ) -> list[bytes] | None:
         """Get device basic settings by sending multiple commands."""
         results = []
         for command in commands:
             result = await self._send_command(command)
-            if not self._check_command_result(result, 0, {1}):
+            if not self._check_command_result(result, 0, COMMAND_SUCCESS):
                 return None
             results.append(result)
         return results
@@ -168,17 +189,35 @@ class SwitchbotBaseLight(SwitchbotDevice):
 class SwitchbotSequenceBaseLight(SwitchbotBaseLight):
     """Representation of a Switchbot light."""
 
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Switchbot sequence light constructor."""
+        super().__init__(*args, **kwargs)
+        self._update_task: asyncio.Task[None] | None = None
+        self._update_pending = False
+
     def update_from_advertisement(self, advertisement: SwitchBotAdvertisement) -> None:
         """Update device data from advertisement."""
         current_state = self._get_adv_value("sequence_number")
         super().update_from_advertisement(advertisement)
         new_state = self._get_adv_value("sequence_number")
-        _LOGGER.debug(
-            "%s: update advertisement: %s (seq before: %s) (seq after: %s)",
-            self.name,
-            advertisement,
-            current_state,
-            new_state,
-        )
-        if current_state != new_state:
-            create_background_task(self.update())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "%s: update advertisement: %s (seq before: %s) (seq after: %s)",
+                self.name,
+                advertisement,
+                current_state,
+                new_state,
+            )
+        if current_state == new_state:
+            return
+        if self._update_task and not self._update_task.done():
+            self._update_pending = True
+            return
+        self._update_task = create_background_task(self._coalesced_update())
+
+    async def _coalesced_update(self) -> None:
+        """Update, repeating while sequence changes arrive mid-update."""
+        self._update_pending = True
+        while self._update_pending:
+            self._update_pending = False
+            await self.update()
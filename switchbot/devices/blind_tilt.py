@@ -76,21 +76,21 @@ class SwitchbotBlindTilt(SwitchbotBaseCover, SwitchbotSequenceDevice):
         """Send open command."""
         self._is_opening = True
         self._is_closing = False
-        return await self._send_multiple_commands(OPEN_KEYS)
+        return await self._send_multiple_commands(OPEN_KEYS, stop_on_success=True)
 
     @update_after_operation
     async def close_up(self) -> bool:
         """Send close up command."""
         self._is_opening = False
         self._is_closing = True
-        return await self._send_multiple_commands(CLOSE_UP_KEYS)
+        return await self._send_multiple_commands(CLOSE_UP_KEYS, stop_on_success=True)
 
     @update_after_operation
     async def close_down(self) -> bool:
         """Send close down command."""
         self._is_opening = False
         self._is_closing = True
-        return await self._send_multiple_commands(CLOSE_DOWN_KEYS)
+        return await self._send_multiple_commands(CLOSE_DOWN_KEYS, stop_on_success=True)
 
     # The aim of this is to close to the nearest endpoint.
     # If we're open upwards we close up, if we're open downwards we close down.
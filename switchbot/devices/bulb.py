@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import struct
 from typing import Any
 
 from ..const.light import BulbColorMode, ColorMode
@@ -12,22 +13,28 @@ _BULB_COLOR_MODE_MAP = {
     BulbColorMode.DYNAMIC: ColorMode.EFFECT,
     BulbColorMode.UNKNOWN: ColorMode.OFF,
 }
+_BULB_COLOR_MODE_BY_VALUE = {
+    mode.value: color_mode for mode, color_mode in _BULB_COLOR_MODE_MAP.items()
+}
 COLOR_BULB_CONTROL_HEADER = "570F4701"
 
+# status, brightness, r, g, b, color temperature, color mode
+_BASIC_INFO_STRUCT = struct.Struct(">BBBBBHxxB")
+
 
 class SwitchbotBulb(SwitchbotSequenceBaseLight):
     """Representation of a Switchbot bulb."""
 
-    _turn_on_command = f"{COLOR_BULB_CONTROL_HEADER}01"
-    _turn_off_command = f"{COLOR_BULB_CONTROL_HEADER}02"
+    _turn_on_command = bytes.fromhex(f"{COLOR_BULB_CONTROL_HEADER}01")
+    _turn_off_command = bytes.fromhex(f"{COLOR_BULB_CONTROL_HEADER}02")
     _set_rgb_command = f"{COLOR_BULB_CONTROL_HEADER}12{{}}"
     _set_color_temp_command = f"{COLOR_BULB_CONTROL_HEADER}13{{}}"
     _set_brightness_command = f"{COLOR_BULB_CONTROL_HEADER}14{{}}"
-    _get_basic_info_command = ["570003", "570f4801"]
+    _get_basic_info_command = [bytes.fromhex("570003"), bytes.fromhex("570f4801")]
     _effect_dict = {
-        "colorful": ["570F4701010300"],
-        "flickering": ["570F4701010301"],
-        "breathing": ["570F4701010302"],
+        "colorful": [bytes.fromhex("570F4701010300")],
+        "flickering": [bytes.fromhex("570F4701010301")],
+        "breathing": [bytes.fromhex("570F4701010302")],
     }
 
     @property
@@ -38,8 +45,9 @@ class SwitchbotBulb(SwitchbotSequenceBaseLight):
     @property
     def color_mode(self) -> ColorMode:
         """Return the current color mode."""
-        device_mode = BulbColorMode(self._get_adv_value("color_mode") or 10)
-        return _BULB_COLOR_MODE_MAP.get(device_mode, ColorMode.OFF)
+        return _BULB_COLOR_MODE_BY_VALUE.get(
+            self._get_adv_value("color_mode") or 10, ColorMode.OFF
+        )
 
     async def get_basic_info(self) -> dict[str, Any] | None:
         """Get device basic settings."""
@@ -48,19 +56,18 @@ class SwitchbotBulb(SwitchbotSequenceBaseLight):
         ):
             return None
         _version_info, _data = res
-
-        self._state["r"] = _data[3]
-        self._state["g"] = _data[4]
-        self._state["b"] = _data[5]
-        self._state["cw"] = int.from_bytes(_data[6:8], "big")
+        status, brightness, r, g, b, cw, color_mode = _BASIC_INFO_STRUCT.unpack_from(
+            _data, 1
+        )
+        self._state.update(r=r, g=g, b=b, cw=cw)
 
         return {
-            "isOn": bool(_data[1] & 0b10000000),
-            "brightness": _data[2] & 0b01111111,
-            "r": self._state["r"],
-            "g": self._state["g"],
-            "b": self._state["b"],
-            "cw": self._state["cw"],
-            "color_mode": _data[10] & 0b00001111,
+            "isOn": bool(status & 0b10000000),
+            "brightness": brightness & 0b01111111,
+            "r": r,
+            "g": g,
+            "b": b,
+            "cw": cw,
+            "color_mode": color_mode & 0b00001111,
             "firmware": _version_info[2] / 10.0,
         }
@@ -7,8 +7,9 @@ from ..const.light import (
     CeilingLightColorMode,
     ColorMode,
 )
+from ..helpers import HEX_BYTE
 from .base_light import SwitchbotSequenceBaseLight
-from .device import update_after_operation
+from .device import COMMAND_SUCCESS, update_after_operation
 
 # Private mapping from device-specific color modes to original ColorMode enum
 _CEILING_LIGHT_COLOR_MODE_MAP = {
@@ -17,17 +18,20 @@ _CEILING_LIGHT_COLOR_MODE_MAP = {
     CeilingLightColorMode.MUSIC: ColorMode.EFFECT,
     CeilingLightColorMode.UNKNOWN: ColorMode.OFF,
 }
+_CEILING_LIGHT_COLOR_MODE_BY_VALUE = {
+    mode.value: color_mode for mode, color_mode in _CEILING_LIGHT_COLOR_MODE_MAP.items()
+}
 CEILING_LIGHT_CONTROL_HEADER = "570F5401"
 
 
 class SwitchbotCeilingLight(SwitchbotSequenceBaseLight):
     """Representation of a Switchbot ceiling light."""
 
-    _turn_on_command = f"{CEILING_LIGHT_CONTROL_HEADER}01FF01FFFF"
-    _turn_off_command = f"{CEILING_LIGHT_CONTROL_HEADER}02FF01FFFF"
+    _turn_on_command = bytes.fromhex(f"{CEILING_LIGHT_CONTROL_HEADER}01FF01FFFF")
+    _turn_off_command = bytes.fromhex(f"{CEILING_LIGHT_CONTROL_HEADER}02FF01FFFF")
     _set_brightness_command = f"{CEILING_LIGHT_CONTROL_HEADER}01FF01{{}}"
     _set_color_temp_command = f"{CEILING_LIGHT_CONTROL_HEADER}01FF01{{}}"
-    _get_basic_info_command = ["5702", "570f5581"]
+    _get_basic_info_command = [bytes.fromhex("5702"), bytes.fromhex("570f5581")]
 
     @property
     def color_modes(self) -> set[ColorMode]:
@@ -37,20 +41,22 @@ class SwitchbotCeilingLight(SwitchbotSequenceBaseLight):
     @property
     def color_mode(self) -> ColorMode:
         """Return the current color mode."""
-        device_mode = CeilingLightColorMode(
-            value if (value := self._get_adv_value("color_mode")) is not None else 10
+        return _CEILING_LIGHT_COLOR_MODE_BY_VALUE.get(
+            self._get_adv_value("color_mode"), ColorMode.OFF
         )
-        return _CEILING_LIGHT_COLOR_MODE_MAP.get(device_mode, ColorMode.OFF)
 
     @update_after_operation
     async def set_brightness(self, brightness: int) -> bool:
         """Set brightness."""
         assert 0 <= brightness <= 100, "Brightness must be between 0 and 100"
-        hex_brightness = f"{brightness:02X}"
         color_temp = self._state.get("cw", DEFAULT_COLOR_TEMP)
-        hex_data = f"{hex_brightness}{color_temp:04X}"
+        hex_data = (
+            HEX_BYTE[brightness]
+            + HEX_BYTE[color_temp >> 8]
+            + HEX_BYTE[color_temp & 0xFF]
+        )
         result = await self._send_command(self._set_brightness_command.format(hex_data))
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     async def get_basic_info(self) -> dict[str, Any] | None:
         """Get device basic settings."""
@@ -126,6 +126,8 @@ KEY_PASSWORD_PREFIX = "571"
 
 DBUS_ERROR_BACKOFF_TIME = 0.25
 
+COMMAND_SUCCESS = frozenset({1})
+
 # How long to hold the connection
 # to wait for additional commands for
 # disconnecting the device.
@@ -162,18 +164,26 @@ def _normalize_encryption_mode(mode: int) -> AESMode:
         raise ValueError(f"Unsupported encryption mode: {mode}") from exc
 
 
+_SB_TX_UUID = UUID("cba20002-224d-11e6-9fb8-0002a5d5c51b")
+_SB_RX_UUID = UUID("cba20003-224d-11e6-9fb8-0002a5d5c51b")
+_SB_SERVICE_UUID = UUID("cba20d00-224d-11e6-9fb8-0002a5d5c51b")
+_SB_UUIDS = {"tx": _SB_TX_UUID, "rx": _SB_RX_UUID, "service": _SB_SERVICE_UUID}
+
+
 def _sb_uuid(comms_type: str = "service") -> UUID | str:
     """Return Switchbot UUID."""
-    _uuid = {"tx": "002", "rx": "003", "service": "d00"}
+    return _SB_UUIDS.get(
+        comms_type, "Incorrect type, choose between: tx, rx or service"
+    )
 
-    if comms_type in _uuid:
-        return UUID(f"cba20{_uuid[comms_type]}-224d-11e6-9fb8-0002a5d5c51b")
 
-    return "Incorrect type, choose between: tx, rx or service"
+READ_CHAR_UUID = _SB_RX_UUID
+WRITE_CHAR_UUID = _SB_TX_UUID
 
 
-READ_CHAR_UUID = _sb_uuid(comms_type="rx")
-WRITE_CHAR_UUID = _sb_uuid(comms_type="tx")
+def _encode_password(password: str) -> str:
+    """Return the CRC32 hex digest sent in place of the password."""
+    return "%08x" % (binascii.crc32(password.encode("ascii")) & 0xFFFFFFFF)
 
 
 WrapFuncType = TypeVar("WrapFuncType", bound=Callable[..., Any])
@@ -212,13 +222,13 @@ def _handle_timeout(fut: asyncio.Future[None]) -> None:
 class SwitchbotBaseDevice:
     """Base Representation of a Switchbot Device."""
 
-    _turn_on_command: str | None = None
-    _turn_off_command: str | None = None
-    _open_command: str | None = None
-    _close_command: str | None = None
-    _press_command: str | None = None
-    _open_child_lock_command: str | None = None
-    _close_child_lock_command: str | None = None
+    _turn_on_command: str | bytes | None = None
+    _turn_off_command: str | bytes | None = None
+    _open_command: str | bytes | None = None
+    _close_command: str | bytes | None = None
+    _press_command: str | bytes | None = None
+    _open_child_lock_command: str | bytes | None = None
+    _close_child_lock_command: str | bytes | None = None
 
     def __init__(
         self,
@@ -231,6 +241,7 @@ class SwitchbotBaseDevice:
         self._interface = f"hci{interface}"
         self._device = device
         self._sb_adv_data: SwitchBotAdvertisement | None = None
+        self._adv_values: dict[Any, Any] | None = None
         self._override_adv_data: dict[str, Any] | None = None
         self._scan_timeout: int = kwargs.pop("scan_timeout", DEFAULT_SCAN_TIMEOUT)
         self._retry_count: int = kwargs.pop("retry_count", DEFAULT_RETRY_COUNT)
@@ -239,13 +250,20 @@ class SwitchbotBaseDevice:
         if password is None or password == "":
             self._password_encoded = None
         else:
-            self._password_encoded = "%08x" % (
-                binascii.crc32(password.encode("ascii")) & 0xFFFFFFFF
-            )
+            self._password_encoded = _encode_password(password)
         self._client: BleakClientWithServiceCache | None = None
         self._read_char: BleakGATTCharacteristic | None = None
         self._write_char: BleakGATTCharacteristic | None = None
+        self._resolved_chars: (
+            tuple[
+                BleakGATTServiceCollection,
+                BleakGATTCharacteristic,
+                BleakGATTCharacteristic,
+            ]
+            | None
+        ) = None
         self._disconnect_timer: asyncio.TimerHandle | None = None
+        self._disconnect_at: float = 0.0
         self._expected_disconnect = False
         self._callbacks: list[Callable[[], None]] = []
         self._notify_future: asyncio.Future[bytearray] | None = None
@@ -404,8 +422,18 @@ class SwitchbotBaseDevice:
         key_suffix = key[4:]
         return KEY_PASSWORD_PREFIX + key_action + self._password_encoded + key_suffix
 
+    def _commandkey_bytes(self, key: bytes) -> bytes:
+        """Add password to a raw command if set."""
+        if self._password_encoded is None:
+            return key
+        return (
+            bytes((0x57, 0x10 | key[1] & 0x0F))
+            + bytes.fromhex(self._password_encoded)
+            + key[2:]
+        )
+
     async def _send_command_locked_with_retry(
-        self, key: str, command: bytes, retry: int, max_attempts: int
+        self, key: str | bytes, command: bytes, retry: int, max_attempts: int
     ) -> bytes | None:
         for attempt in range(max_attempts):
             try:
@@ -452,12 +480,18 @@ class SwitchbotBaseDevice:
 
         raise RuntimeError("Unreachable")
 
-    async def _send_command(self, key: str, retry: int | None = None) -> bytes | None:
-        """Send command to device and read response."""
+    async def _send_command(
+        self, key: str | bytes, retry: int | None = None
+    ) -> bytes | None:
+        """Send a hex string or raw bytes command to device and read response."""
         if retry is None:
             retry = self._retry_count
-        command = bytearray.fromhex(self._commandkey(key))
-        _LOGGER.debug("%s: Scheduling command %s", self.name, command.hex())
+        if isinstance(key, bytes):
+            command = self._commandkey_bytes(key)
+        else:
+            command = bytes.fromhex(self._commandkey(key))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("%s: Scheduling command %s", self.name, command.hex())
         max_attempts = retry + 1
         if self._operation_lock.locked():
             _LOGGER.debug(
@@ -557,20 +591,30 @@ class SwitchbotBaseDevice:
 
     def _resolve_characteristics(self, services: BleakGATTServiceCollection) -> None:
         """Resolve characteristics."""
+        # A reconnect served from the services cache hands back the same
+        # collection, so the characteristics resolved from it are still valid.
+        if (resolved := self._resolved_chars) and resolved[0] is services:
+            self._read_char, self._write_char = resolved[1], resolved[2]
+            return
         self._read_char = services.get_characteristic(READ_CHAR_UUID)
         if not self._read_char:
             raise CharacteristicMissingError(READ_CHAR_UUID)
         self._write_char = services.get_characteristic(WRITE_CHAR_UUID)
         if not self._write_char:
             raise CharacteristicMissingError(WRITE_CHAR_UUID)
+        self._resolved_chars = (services, self._read_char, self._write_char)
 
     def _reset_disconnect_timer(self):
         """Reset disconnect timer."""
-        self._cancel_disconnect_timer()
         self._expected_disconnect = False
-        self._disconnect_timer = asyncio.get_running_loop().call_later(
-            DISCONNECT_DELAY, self._disconnect_from_timer
-        )
+        loop = asyncio.get_running_loop()
+        self._disconnect_at = loop.time() + DISCONNECT_DELAY
+        # Pending timers are left in place and only the deadline moves;
+        # _disconnect_from_timer re-arms itself if it fires early.
+        if not self._disconnect_timer:
+            self._disconnect_timer = loop.call_at(
+                self._disconnect_at, self._disconnect_from_timer
+            )
 
     def _disconnected(self, client: BleakClientWithServiceCache) -> None:
         """Disconnected callback."""
@@ -588,6 +632,13 @@ class SwitchbotBaseDevice:
 
     def _disconnect_from_timer(self):
         """Disconnect from device."""
+        self._disconnect_timer = None
+        loop = asyncio.get_running_loop()
+        if loop.time() < self._disconnect_at:
+            self._disconnect_timer = loop.call_at(
+                self._disconnect_at, self._disconnect_from_timer
+            )
+            return
         if self._operation_lock.locked() and self._client.is_connected:
             _LOGGER.debug(
                 "%s: Operation in progress, resetting disconnect timer; RSSI: %s",
@@ -659,7 +710,7 @@ class SwitchbotBaseDevice:
         else:
             _LOGGER.debug("%s: Disconnect completed successfully", self.name)
 
-    async def _send_command_locked(self, key: str, command: bytes) -> bytes:
+    async def _send_command_locked(self, key: str | bytes, command: bytes) -> bytes:
         """Send command to device and read response."""
         await self._ensure_connected()
         try:
@@ -696,7 +747,7 @@ class SwitchbotBaseDevice:
         _LOGGER.debug("%s: Subscribe to notifications; RSSI: %s", self.name, self.rssi)
         await self._client.start_notify(self._read_char, self._notification_handler)
 
-    async def _execute_command_locked(self, key: str, command: bytes) -> bytes:
+    async def _execute_command_locked(self, key: str | bytes, command: bytes) -> bytes:
         """Execute command and read response."""
         assert self._client is not None
         assert self._read_char is not None
@@ -705,7 +756,8 @@ class SwitchbotBaseDevice:
         self._notify_future = loop.create_future()
         client = self._client
 
-        _LOGGER.debug("%s: Sending command: %s", self.name, key)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("%s: Sending command: %s", self.name, command.hex())
         await client.write_gatt_char(self._write_char, command, False)
 
         timeout = 5
@@ -723,12 +775,14 @@ class SwitchbotBaseDevice:
                 timeout_handle.cancel()
             self._notify_future = None
 
-        _LOGGER.debug("%s: Notification received: %s", self.name, notify_msg.hex())
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("%s: Notification received: %s", self.name, notify_msg.hex())
 
-        if notify_msg == b"\x07":
-            _LOGGER.error("Password required")
-        elif notify_msg == b"\t":
-            _LOGGER.error("Password incorrect")
+        if len(notify_msg) == 1:
+            if notify_msg[0] == 0x07:
+                _LOGGER.error("Password required")
+            elif notify_msg[0] == 0x09:
+                _LOGGER.error("Password incorrect")
         return notify_msg
 
     def get_address(self) -> str:
@@ -752,11 +806,11 @@ class SwitchbotBaseDevice:
                 self._override_adv_data[key],
             )
             return self._override_adv_data[key]
-        if not self._sb_adv_data:
+        if (values := self._adv_values) is None:
             return None
         if channel is not None:
-            return self._sb_adv_data.data["data"].get(channel, {}).get(key)
-        return self._sb_adv_data.data["data"].get(key)
+            return values.get(channel, {}).get(key)
+        return values.get(key)
 
     def get_battery_percent(self) -> Any:
         """Return device battery level in percent."""
@@ -786,6 +840,7 @@ class SwitchbotBaseDevice:
 
         if self._device.address in _data:
             self._sb_adv_data = _data[self._device.address]
+            self._adv_values = self._sb_adv_data.data.get("data")
 
         return self._sb_adv_data
 
@@ -834,7 +889,7 @@ class SwitchbotBaseDevice:
         }
 
     def _check_command_result(
-        self, result: bytes | None, index: int, values: set[int]
+        self, result: bytes | None, index: int, values: set[int] | frozenset[int]
     ) -> bool:
         """Check command result."""
         if not result or len(result) - 1 < index:
@@ -867,6 +922,7 @@ class SwitchbotBaseDevice:
         self._sb_adv_data = replace(
             advertisement, data=self._sb_adv_data.data | {"data": data}
         )
+        self._adv_values = data
 
     def _set_advertisement_data(self, advertisement: SwitchBotAdvertisement) -> None:
         """Set advertisement data."""
@@ -877,6 +933,7 @@ class SwitchbotBaseDevice:
             self._last_full_update = time.monotonic()
         if not self._sb_adv_data:
             self._sb_adv_data = advertisement
+            self._adv_values = advertisement.data.get("data")
         elif new_data:
             self._update_parsed_data(new_data)
         self._override_adv_data = None
@@ -896,7 +953,7 @@ class SwitchbotBaseDevice:
         time_since_last_full_update = time.monotonic() - self._last_full_update
         return not time_since_last_full_update < PASSIVE_POLL_INTERVAL
 
-    def _check_function_support(self, cmd: str | None = None) -> None:
+    def _check_function_support(self, cmd: str | bytes | None = None) -> None:
         """Check if the command is supported by the device model."""
         if not cmd:
             raise SwitchbotOperationError(
@@ -908,49 +965,49 @@ class SwitchbotBaseDevice:
         """Turn device on."""
         self._check_function_support(self._turn_on_command)
         result = await self._send_command(self._turn_on_command)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def turn_off(self) -> bool:
         """Turn device off."""
         self._check_function_support(self._turn_off_command)
         result = await self._send_command(self._turn_off_command)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def open(self) -> bool:
         """Open the device."""
         self._check_function_support(self._open_command)
         result = await self._send_command(self._open_command)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def close(self) -> bool:
         """Close the device."""
         self._check_function_support(self._close_command)
         result = await self._send_command(self._close_command)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def press(self) -> bool:
         """Press the device."""
         self._check_function_support(self._press_command)
         result = await self._send_command(self._press_command)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def open_child_lock(self) -> bool:
         """Open the child lock."""
         self._check_function_support(self._open_child_lock_command)
         result = await self._send_command(self._open_child_lock_command)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def close_child_lock(self) -> bool:
         """Close the child lock."""
         self._check_function_support(self._close_child_lock_command)
         result = await self._send_command(self._close_child_lock_command)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
 
 class SwitchbotDevice(SwitchbotBaseDevice):
@@ -967,21 +1024,27 @@ class SwitchbotDevice(SwitchbotBaseDevice):
         super().update_from_advertisement(advertisement)
         self._set_advertisement_data(advertisement)
 
-    async def _send_multiple_commands(self, keys: list[str]) -> bool:
+    async def _send_multiple_commands(
+        self, keys: list[str] | list[bytes], stop_on_success: bool = False
+    ) -> bool:
         """
         Send multiple commands to device.
 
         Returns True if any command succeeds. Used when we don't know
         which command the device needs, so we send multiple and consider
-        it successful if any one works.
+        it successful if any one works. With stop_on_success, the remaining
+        commands are skipped once one succeeds; only use it when the
+        commands are alternative encodings of the same action.
         """
         final_result = False
         for key in keys:
             result = await self._send_command(key)
-            final_result |= self._check_command_result(result, 0, {1})
+            final_result |= self._check_command_result(result, 0, COMMAND_SUCCESS)
+            if final_result and stop_on_success:
+                return True
         return final_result
 
-    async def _send_command_sequence(self, keys: list[str]) -> bool:
+    async def _send_command_sequence(self, keys: list[str] | list[bytes]) -> bool:
         """
         Send a sequence of commands to device where all must succeed.
 
@@ -989,7 +1052,7 @@ class SwitchbotDevice(SwitchbotBaseDevice):
         """
         for key in keys:
             result = await self._send_command(key)
-            if not self._check_command_result(result, 0, {1}):
+            if not self._check_command_result(result, 0, COMMAND_SUCCESS):
                 return False
         return True
 
@@ -1022,9 +1085,11 @@ class SwitchbotEncryptedDevice(SwitchbotDevice):
         if len(encryption_key) != 32:
             raise ValueError("encryption_key is invalid")
         self._key_id = key_id
-        self._encryption_key = bytearray.fromhex(encryption_key)
+        self._key_id_bytes = bytes.fromhex(key_id)
+        self._encryption_key = bytes.fromhex(encryption_key)
         self._iv: bytes | None = None
         self._cipher: Cipher | None = None
+        self._ctr_keystream: tuple[bytes, bytes] | None = None
         self._encryption_mode: AESMode | None = None
         super().__init__(device, None, interface, **kwargs)
         self._model = model
@@ -1112,9 +1177,13 @@ class SwitchbotEncryptedDevice(SwitchbotDevice):
         return info is not None
 
     async def _send_command(
-        self, key: str, retry: int | None = None, encrypt: bool = True
+        self, key: str | bytes, retry: int | None = None, encrypt: bool = True
     ) -> bytes | None:
         if not encrypt:
+            if isinstance(key, bytes):
+                return await super()._send_command(
+                    key[:1] + b"\x00\x00\x00" + key[1:], retry
+                )
             return await super()._send_command(key[:2] + "000000" + key[2:], retry)
 
         if retry is None:
@@ -1132,14 +1201,16 @@ class SwitchbotEncryptedDevice(SwitchbotDevice):
                 _LOGGER.error("Failed to initialize encryption")
                 return None
 
-            ciphertext_hex, header_hex = self._encrypt(key[2:])
-            encrypted = key[:2] + self._key_id + header_hex + ciphertext_hex
-            command = bytearray.fromhex(self._commandkey(encrypted))
-            _LOGGER.debug("%s: Scheduling command %s", self.name, command.hex())
+            if isinstance(key, str):
+                key = bytes.fromhex(key)
+            ciphertext, header = self._encrypt(key[1:])
+            command = key[:1] + self._key_id_bytes + header + ciphertext
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("%s: Scheduling command %s", self.name, command.hex())
             max_attempts = retry + 1
 
             result = await self._send_command_locked_with_retry(
-                encrypted, command, retry, max_attempts
+                command, command, retry, max_attempts
             )
             if result is None:
                 return None
@@ -1158,10 +1229,11 @@ class SwitchbotEncryptedDevice(SwitchbotDevice):
         _LOGGER.debug("%s: Initializing encryption", self.name)
         # Call parent's _send_command_locked_with_retry directly since we already hold the lock
         key = COMMAND_GET_CK_IV + self._key_id
-        command = bytearray.fromhex(self._commandkey(key[:2] + "000000" + key[2:]))
+        key = key[:2] + "000000" + key[2:]
+        command = bytes.fromhex(self._commandkey(key))
 
         result = await self._send_command_locked_with_retry(
-            key[:2] + "000000" + key[2:],
+            key,
             command,
             self._retry_count,
             self._retry_count + 1,
@@ -1169,7 +1241,7 @@ class SwitchbotEncryptedDevice(SwitchbotDevice):
         if result is None:
             return False
 
-        if ok := self._check_command_result(result, 0, {1}):
+        if ok := self._check_command_result(result, 0, COMMAND_SUCCESS):
             _LOGGER.debug("%s: Encryption init response: %s", self.name, result.hex())
             mode_byte = result[2] if len(result) > 2 else None
             self._resolve_encryption_mode(mode_byte)
@@ -1221,23 +1293,20 @@ class SwitchbotEncryptedDevice(SwitchbotDevice):
                 )
         return self._cipher
 
-    def _encrypt(self, data: str) -> tuple[str, str]:
-        if len(data) == 0:
-            return "", ""
+    def _encrypt(self, data: bytes) -> tuple[bytes, bytes]:
+        """Return the ciphertext and the 2-byte header sent ahead of it."""
         if self._iv is None:
             raise RuntimeError("Cannot encrypt: IV is None")
+        if self._encryption_mode != AESMode.GCM:
+            return self._ctr_xor(data), self._iv[0:2]
         encryptor = self._get_cipher().encryptor()
-        ciphertext = encryptor.update(bytearray.fromhex(data)) + encryptor.finalize()
-        if self._encryption_mode == AESMode.GCM:
-            header_hex = encryptor.tag[:2].hex()
-            # GCM cipher is single-use; clear it so _get_cipher() creates a fresh one
-            self._cipher = None
-        else:
-            header_hex = self._iv[0:2].hex()
-        return ciphertext.hex(), header_hex
+        ciphertext = encryptor.update(data) + encryptor.finalize()
+        # GCM cipher is single-use; clear it so _get_cipher() creates a fresh one
+        self._cipher = None
+        return ciphertext, encryptor.tag[:2]
 
     def _decrypt(self, data: bytearray) -> bytes:
-        if len(data) == 0:
+        if not data:
             return b""
         if self._iv is None:
             if self._expected_disconnect:
@@ -1256,8 +1325,21 @@ class SwitchbotEncryptedDevice(SwitchbotDevice):
                 modes.GCM(self._iv, b"\x00" * 16),
             ).decryptor()
             return decryptor.update(data)
-        decryptor = self._get_cipher().decryptor()
-        return decryptor.update(data) + decryptor.finalize()
+        return self._ctr_xor(data)
+
+    def _ctr_xor(self, data: bytes | bytearray) -> bytes:
+        """Apply the AES-CTR keystream that starts at the current IV."""
+        # Every command restarts the counter at the IV, so the keystream only
+        # changes with the IV and can be generated once instead of per command.
+        size = len(data)
+        cached = self._ctr_keystream
+        if cached is None or cached[0] != self._iv or len(cached[1]) < size:
+            encryptor = self._get_cipher().encryptor()
+            keystream = encryptor.update(bytes(max(size, 64))) + encryptor.finalize()
+            self._ctr_keystream = cached = (self._iv, keystream)
+        return (
+            int.from_bytes(data, "big") ^ int.from_bytes(cached[1][:size], "big")
+        ).to_bytes(size, "big")
 
     def _increment_gcm_iv(self) -> None:
         """Increment GCM IV by 1 (big-endian). Called after each encrypted command."""
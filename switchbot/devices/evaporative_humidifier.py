@@ -1,15 +1,19 @@
 import logging
+import struct
 from typing import Any
 
 from ..adv_parsers.humidifier import calculate_temperature_and_humidity
 from ..const import SwitchbotModel
 from ..const.evaporative_humidifier import (
+    HUMIDIFIER_MODES_BY_VALUE,
     TARGET_HUMIDITY_MODES,
+    WATER_LEVEL_NAMES,
     HumidifierAction,
     HumidifierMode,
     HumidifierWaterLevel,
 )
 from .device import (
+    COMMAND_SUCCESS,
     SwitchbotEncryptedDevice,
     SwitchbotOperationError,
     SwitchbotSequenceDevice,
@@ -20,34 +24,42 @@ _LOGGER = logging.getLogger(__name__)
 
 COMMAND_HEADER = "57"
 COMMAND_GET_CK_IV = f"{COMMAND_HEADER}0f2103"
-COMMAND_TURN_ON = f"{COMMAND_HEADER}0f430101"
-COMMAND_CHILD_LOCK_ON = f"{COMMAND_HEADER}0f430501"
-COMMAND_CHILD_LOCK_OFF = f"{COMMAND_HEADER}0f430500"
-COMMAND_AUTO_DRY_ON = f"{COMMAND_HEADER}0f430a01"
-COMMAND_AUTO_DRY_OFF = f"{COMMAND_HEADER}0f430a02"
-COMMAND_SET_MODE = f"{COMMAND_HEADER}0f4302"
+COMMAND_TURN_ON = bytes.fromhex(f"{COMMAND_HEADER}0f430101")
+COMMAND_TURN_OFF = bytes.fromhex(f"{COMMAND_HEADER}0f430100")
+COMMAND_CHILD_LOCK_ON = bytes.fromhex(f"{COMMAND_HEADER}0f430501")
+COMMAND_CHILD_LOCK_OFF = bytes.fromhex(f"{COMMAND_HEADER}0f430500")
+COMMAND_AUTO_DRY_ON = bytes.fromhex(f"{COMMAND_HEADER}0f430a01")
+COMMAND_AUTO_DRY_OFF = bytes.fromhex(f"{COMMAND_HEADER}0f430a02")
+COMMAND_SET_MODE = bytes.fromhex(f"{COMMAND_HEADER}0f4302")
 COMMAND_GET_BASIC_INFO = f"{COMMAND_HEADER}000300"
-COMMAND_SET_DRYING_FILTER = f"{COMMAND_TURN_ON}08"
+COMMAND_SET_DRYING_FILTER = COMMAND_TURN_ON + b"\x08"
 
 MODES_COMMANDS = {
-    HumidifierMode.HIGH: "010100",
-    HumidifierMode.MEDIUM: "010200",
-    HumidifierMode.LOW: "010300",
-    HumidifierMode.QUIET: "010400",
-    HumidifierMode.TARGET_HUMIDITY: "0200",
-    HumidifierMode.SLEEP: "0300",
-    HumidifierMode.AUTO: "040000",
+    HumidifierMode.HIGH: b"\x01\x01\x00",
+    HumidifierMode.MEDIUM: b"\x01\x02\x00",
+    HumidifierMode.LOW: b"\x01\x03\x00",
+    HumidifierMode.QUIET: b"\x01\x04\x00",
+    HumidifierMode.TARGET_HUMIDITY: b"\x02\x00",
+    HumidifierMode.SLEEP: b"\x03\x00",
+    HumidifierMode.AUTO: b"\x04\x00\x00",
+}
+
+MODE_COMMAND_BYTES = {
+    mode: COMMAND_SET_MODE + code for mode, code in MODES_COMMANDS.items()
 }
 
 DEVICE_GET_BASIC_SETTINGS_KEY = "570f4481"
 
+# status, alerts, meter, water level, filter run time, target humidity
+_BASIC_INFO_STRUCT = struct.Struct(">xBBBxBHxxB")
+
 
 class SwitchbotEvaporativeHumidifier(SwitchbotSequenceDevice, SwitchbotEncryptedDevice):
     """Representation of a Switchbot Evaporative Humidifier"""
 
     _model = SwitchbotModel.EVAPORATIVE_HUMIDIFIER
     _turn_on_command = COMMAND_TURN_ON
-    _turn_off_command = f"{COMMAND_HEADER}0f430100"
+    _turn_off_command = COMMAND_TURN_OFF
     _force_next_update: bool = False
 
     async def get_basic_info(self) -> dict[str, Any] | None:
@@ -56,22 +68,26 @@ class SwitchbotEvaporativeHumidifier(SwitchbotSequenceDevice, SwitchbotEncrypted
             return None
 
         _LOGGER.debug("basic info data: %s", _data.hex())
-        isOn = bool(_data[1] & 0b10000000)
-        mode = HumidifierMode(_data[1] & 0b00001111)
-        over_humidify_protection = bool(_data[2] & 0b10000000)
-        child_lock = bool(_data[2] & 0b00100000)
-        tank_removed = bool(_data[2] & 0b00000100)
-        tilted_alert = bool(_data[2] & 0b00000010)
-        filter_missing = bool(_data[2] & 0b00000001)
-        is_meter_binded = bool(_data[3] & 0b10000000)
+        status, alerts, meter, level, run_time, target = _BASIC_INFO_STRUCT.unpack_from(
+            _data
+        )
+        isOn = bool(status & 0b10000000)
+        mode_value = status & 0b00001111
+        mode = HUMIDIFIER_MODES_BY_VALUE.get(mode_value) or HumidifierMode(mode_value)
+        over_humidify_protection = bool(alerts & 0b10000000)
+        child_lock = bool(alerts & 0b00100000)
+        tank_removed = bool(alerts & 0b00000100)
+        tilted_alert = bool(alerts & 0b00000010)
+        filter_missing = bool(alerts & 0b00000001)
+        is_meter_binded = bool(meter & 0b10000000)
 
         _temp_c, _temp_f, humidity = calculate_temperature_and_humidity(
             _data[3:6], is_meter_binded
         )
 
-        water_level = HumidifierWaterLevel(_data[5] & 0b00000011).name.lower()
-        filter_run_time = int.from_bytes(_data[6:8], byteorder="big") & 0xFFF
-        target_humidity = _data[10] & 0b01111111
+        water_level = WATER_LEVEL_NAMES[level & 0b00000011]
+        filter_run_time = run_time & 0xFFF
+        target_humidity = target & 0b01111111
 
         return {
             "isOn": isOn,
@@ -95,13 +111,9 @@ class SwitchbotEvaporativeHumidifier(SwitchbotSequenceDevice, SwitchbotEncrypted
         """Set target humidity."""
         self._validate_water_level()
         self._validate_mode_for_target_humidity()
-        command = (
-            COMMAND_SET_MODE
-            + MODES_COMMANDS[self.get_mode()]
-            + f"{target_humidity:02x}"
-        )
+        command = MODE_COMMAND_BYTES[self.get_mode()] + bytes((target_humidity,))
         result = await self._send_command(command)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def set_mode(self, mode: HumidifierMode) -> bool:
@@ -112,7 +124,7 @@ class SwitchbotEvaporativeHumidifier(SwitchbotSequenceDevice, SwitchbotEncrypted
         if mode == HumidifierMode.DRYING_FILTER:
             command = COMMAND_SET_DRYING_FILTER
         else:
-            command = COMMAND_SET_MODE + MODES_COMMANDS[mode]
+            command = MODE_COMMAND_BYTES[mode]
 
         if mode in TARGET_HUMIDITY_MODES:
             target_humidity = self.get_target_humidity()
@@ -120,9 +132,9 @@ class SwitchbotEvaporativeHumidifier(SwitchbotSequenceDevice, SwitchbotEncrypted
                 raise SwitchbotOperationError(
                     "Target humidity must be set before switching to target humidity mode or sleep mode"
                 )
-            command += f"{target_humidity:02x}"
+            command += bytes((target_humidity,))
         result = await self._send_command(command)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     def _validate_water_level(self, mode: HumidifierMode | None = None) -> None:
         """Validate that the water level is not empty."""
@@ -157,7 +169,7 @@ class SwitchbotEvaporativeHumidifier(SwitchbotSequenceDevice, SwitchbotEncrypted
         result = await self._send_command(
             COMMAND_CHILD_LOCK_ON if enabled else COMMAND_CHILD_LOCK_OFF
         )
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     def is_on(self) -> bool | None:
         """Return state from cache."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import struct
 from enum import Enum
 from typing import Any, ClassVar
 
@@ -14,6 +15,7 @@ from ..const.fan import (
     VerticalOscillationAngle,
 )
 from .device import (
+    COMMAND_SUCCESS,
     DEVICE_GET_BASIC_SETTINGS_KEY,
     SwitchbotSequenceDevice,
     update_after_operation,
@@ -35,13 +37,17 @@ COMMAND_STOP_VERTICAL_OSCILLATION = f"{COMMAND_HEAD}0201ff02"  # H keep, V stop
 # Standing Fan (dual-axis): start/stop both axes at once.
 COMMAND_START_OSCILLATION_ALL_AXES = f"{COMMAND_HEAD}02010101"
 COMMAND_STOP_OSCILLATION_ALL_AXES = f"{COMMAND_HEAD}02010202"
-COMMAND_SET_OSCILLATION_PARAMS = f"{COMMAND_HEAD}0202"  # +angles
-COMMAND_SET_NIGHT_LIGHT = f"{COMMAND_HEAD}0502"  # +state
+COMMAND_SET_OSCILLATION_PARAMS = bytes.fromhex(f"{COMMAND_HEAD}0202")  # +angles
+COMMAND_SET_NIGHT_LIGHT = bytes.fromhex(f"{COMMAND_HEAD}0502")  # +state
 # Standing Fan (FAN2) extra controls.
-COMMAND_SET_DISPLAY_LIGHT = f"{COMMAND_HEAD}0501"  # +state + FFFF (front LED display)
-COMMAND_SET_SOUND = f"{COMMAND_HEAD}0601"  # +level (64 on / 00 off)
-COMMAND_SET_AUTO_RECENTER = f"{COMMAND_HEAD}0205"  # +both axes (0101 on / 0202 off)
-COMMAND_SET_CHILD_LOCK = f"{COMMAND_HEAD}07"  # +state (01 on / 02 off)
+# +state + FFFF (front LED display)
+COMMAND_SET_DISPLAY_LIGHT = bytes.fromhex(f"{COMMAND_HEAD}0501")
+# +level (64 on / 00 off)
+COMMAND_SET_SOUND = bytes.fromhex(f"{COMMAND_HEAD}0601")
+# +both axes (0101 on / 0202 off)
+COMMAND_SET_AUTO_RECENTER = bytes.fromhex(f"{COMMAND_HEAD}0205")
+# +state (01 on / 02 off)
+COMMAND_SET_CHILD_LOCK = bytes.fromhex(f"{COMMAND_HEAD}07")
 COMMAND_SET_MODE = {
     FanMode.NORMAL.name.lower(): f"{COMMAND_HEAD}030101ff",
     FanMode.NATURAL.name.lower(): f"{COMMAND_HEAD}030102ff",
@@ -52,17 +58,35 @@ COMMAND_SET_STANDING_FAN_MODE = {
     **COMMAND_SET_MODE,
     StandingFanMode.CUSTOM_NATURAL.name.lower(): f"{COMMAND_HEAD}030105",
 }
-COMMAND_SET_PERCENTAGE = f"{COMMAND_HEAD}0302"  #  +speed
+# Decoded mode commands keyed by both the enum member and its lowercase name
+# so either form of preset mode resolves with a single lookup.
+_MODE_COMMANDS: dict[FanMode | str, bytes] = {
+    key: bytes.fromhex(COMMAND_SET_MODE[mode.name.lower()])
+    for mode in FanMode
+    for key in (mode, mode.name.lower())
+}
+_STANDING_FAN_MODE_COMMANDS: dict[StandingFanMode | str, bytes] = {
+    key: bytes.fromhex(COMMAND_SET_STANDING_FAN_MODE[mode.name.lower()])
+    for mode in StandingFanMode
+    for key in (mode, mode.name.lower())
+}
+COMMAND_SET_PERCENTAGE = bytes.fromhex(f"{COMMAND_HEAD}0302")  #  +speed
 COMMAND_GET_BASIC_INFO = "570f428102"
 
+_FAN_MODE_NAMES = {mode.value: mode.name.lower() for mode in FanMode}
+_STANDING_FAN_MODE_NAMES = {mode.value: mode.name.lower() for mode in StandingFanMode}
+
+# battery, status, mode, speed
+_BASIC_INFO_STRUCT = struct.Struct(">xxBBxxxxBB")
+
 
 class SwitchbotFan(SwitchbotSequenceDevice):
     """Representation of a Switchbot Circulator Fan."""
 
-    _turn_on_command = f"{COMMAND_HEAD}0101"
-    _turn_off_command = f"{COMMAND_HEAD}0102"
-    _mode_enum: ClassVar[type[Enum]] = FanMode
-    _command_set_mode: ClassVar[dict[str, str]] = COMMAND_SET_MODE
+    _turn_on_command = bytes.fromhex(f"{COMMAND_HEAD}0101")
+    _turn_off_command = bytes.fromhex(f"{COMMAND_HEAD}0102")
+    _mode_names: ClassVar[dict[int, str]] = _FAN_MODE_NAMES
+    _command_set_mode: ClassVar[dict[Any, bytes]] = _MODE_COMMANDS
     _command_start_oscillation: ClassVar[str] = COMMAND_START_OSCILLATION
     _command_stop_oscillation: ClassVar[str] = COMMAND_STOP_OSCILLATION
 
@@ -78,16 +102,13 @@ class SwitchbotFan(SwitchbotSequenceDevice):
 
     def _parse_basic_info(self, _data: bytes, _data1: bytes) -> dict[str, Any]:
         """Decode the basic-info connection response into a state dict."""
-        battery = _data[2] & 0b01111111
-        isOn = bool(_data[3] & 0b10000000)
-        oscillating_horizontal = bool(_data[3] & 0b01000000)
-        oscillating_vertical = bool(_data[3] & 0b00100000)
+        battery, status, _mode, speed = _BASIC_INFO_STRUCT.unpack_from(_data)
+        battery &= 0b01111111
+        isOn = bool(status & 0b10000000)
+        oscillating_horizontal = bool(status & 0b01000000)
+        oscillating_vertical = bool(status & 0b00100000)
         oscillating = oscillating_horizontal or oscillating_vertical
-        _mode = _data[8] & 0b00000111
-        mode_enum = self._mode_enum
-        max_mode = max(m.value for m in mode_enum)
-        mode = mode_enum(_mode).name.lower() if 1 <= _mode <= max_mode else None
-        speed = _data[9]
+        mode = self._mode_names.get(_mode & 0b00000111)
         firmware = _data1[2] / 10.0
 
         info: dict[str, Any] = {
@@ -118,16 +139,16 @@ class SwitchbotFan(SwitchbotSequenceDevice):
         return _data
 
     @update_after_operation
-    async def set_preset_mode(self, preset_mode: str) -> bool:
+    async def set_preset_mode(self, preset_mode: Enum | str) -> bool:
         """Send command to set fan preset_mode."""
         result = await self._send_command(self._command_set_mode[preset_mode])
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def set_percentage(self, percentage: int) -> bool:
         """Send command to set fan percentage."""
-        result = await self._send_command(f"{COMMAND_SET_PERCENTAGE}{percentage:02X}")
-        return self._check_command_result(result, 0, {1})
+        result = await self._send_command(COMMAND_SET_PERCENTAGE + bytes((percentage,)))
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def set_oscillation(self, oscillating: bool) -> bool:
@@ -138,7 +159,7 @@ class SwitchbotFan(SwitchbotSequenceDevice):
             else self._command_stop_oscillation
         )
         result = await self._send_command(cmd)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def set_horizontal_oscillation(self, oscillating: bool) -> bool:
@@ -149,7 +170,7 @@ class SwitchbotFan(SwitchbotSequenceDevice):
             else COMMAND_STOP_HORIZONTAL_OSCILLATION
         )
         result = await self._send_command(cmd)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def set_vertical_oscillation(self, oscillating: bool) -> bool:
@@ -160,7 +181,7 @@ class SwitchbotFan(SwitchbotSequenceDevice):
             else COMMAND_STOP_VERTICAL_OSCILLATION
         )
         result = await self._send_command(cmd)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     def get_current_percentage(self) -> Any:
         """Return cached percentage."""
@@ -190,8 +211,8 @@ class SwitchbotFan(SwitchbotSequenceDevice):
 class SwitchbotStandingFan(SwitchbotFan):
     """Representation of a Switchbot Standing Fan (FAN2)."""
 
-    _mode_enum: ClassVar[type[Enum]] = StandingFanMode
-    _command_set_mode: ClassVar[dict[str, str]] = COMMAND_SET_STANDING_FAN_MODE
+    _mode_names: ClassVar[dict[int, str]] = _STANDING_FAN_MODE_NAMES
+    _command_set_mode: ClassVar[dict[Any, bytes]] = _STANDING_FAN_MODE_COMMANDS
     _command_start_oscillation: ClassVar[str] = COMMAND_START_OSCILLATION_ALL_AXES
     _command_stop_oscillation: ClassVar[str] = COMMAND_STOP_OSCILLATION_ALL_AXES
 
@@ -217,9 +238,9 @@ class SwitchbotStandingFan(SwitchbotFan):
     ) -> bool:
         """Set horizontal oscillation angle (30 / 60 / 90 degrees)."""
         value = HorizontalOscillationAngle(angle).value
-        cmd = f"{COMMAND_SET_OSCILLATION_PARAMS}{value:02X}FFFFFF"
+        cmd = COMMAND_SET_OSCILLATION_PARAMS + bytes((value, 0xFF, 0xFF, 0xFF))
         result = await self._send_command(cmd)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def set_vertical_oscillation_angle(
@@ -234,45 +255,47 @@ class SwitchbotStandingFan(SwitchbotFan):
         `VerticalOscillationAngle` (or the raw byte values 30 / 60 / 95).
         """
         value = VerticalOscillationAngle(angle).value
-        cmd = f"{COMMAND_SET_OSCILLATION_PARAMS}FFFF{value:02X}FF"
+        cmd = COMMAND_SET_OSCILLATION_PARAMS + bytes((0xFF, 0xFF, value, 0xFF))
         result = await self._send_command(cmd)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def set_night_light(self, state: NightLightState | int) -> bool:
         """Set night-light state (LEVEL_1, LEVEL_2, OFF)."""
         value = NightLightState(state).value
-        cmd = f"{COMMAND_SET_NIGHT_LIGHT}{value:02X}FFFF"
+        cmd = COMMAND_SET_NIGHT_LIGHT + bytes((value, 0xFF, 0xFF))
         result = await self._send_command(cmd)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def set_child_lock(self, enabled: bool) -> bool:
         """Enable or disable the child lock."""
-        cmd = f"{COMMAND_SET_CHILD_LOCK}{'01' if enabled else '02'}"
+        cmd = COMMAND_SET_CHILD_LOCK + (b"\x01" if enabled else b"\x02")
         result = await self._send_command(cmd)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def set_display(self, enabled: bool) -> bool:
         """Turn the front display (LED) on or off."""
-        cmd = f"{COMMAND_SET_DISPLAY_LIGHT}{'01' if enabled else '02'}FFFF"
+        cmd = COMMAND_SET_DISPLAY_LIGHT + (
+            b"\x01\xff\xff" if enabled else b"\x02\xff\xff"
+        )
         result = await self._send_command(cmd)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def set_sound(self, enabled: bool) -> bool:
         """Turn the key tone (buzzer) on or off."""
-        cmd = f"{COMMAND_SET_SOUND}{'64' if enabled else '00'}"
+        cmd = COMMAND_SET_SOUND + (b"\x64" if enabled else b"\x00")
         result = await self._send_command(cmd)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def set_auto_recenter(self, enabled: bool) -> bool:
         """Enable or disable auto return-to-center on both axes."""
-        cmd = f"{COMMAND_SET_AUTO_RECENTER}{'0101' if enabled else '0202'}"
+        cmd = COMMAND_SET_AUTO_RECENTER + (b"\x01\x01" if enabled else b"\x02\x02")
         result = await self._send_command(cmd)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     def get_horizontal_oscillation_angle(self) -> int | None:
         """Return cached horizontal oscillation angle (raw device byte)."""
@@ -1,7 +1,7 @@
 """Keypad Vision (Pro) device handling."""
 
 import logging
-import re
+import struct
 from typing import Any
 
 from bleak.backends.device import BLEDevice
@@ -9,8 +9,15 @@ from bleak.backends.device import BLEDevice
 from ..const import SwitchbotModel
 from .device import SwitchbotEncryptedDevice, SwitchbotSequenceDevice
 
-PASSWORD_RE = re.compile(r"^\d{6,12}$")
 COMMAND_GET_PASSWORD_COUNT = "570F530100"
+COMMAND_ADD_PASSWORD = bytes.fromhex("570F520202")
+
+# Maps ASCII "0"-"9" to the digit values 0-9 sent in the password payload.
+_DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+
+# battery, firmware, hardware, fingerprint support, lock button, tamper alarm,
+# backlight, backlight level, prompt tone, charging
+_BASIC_INFO_STRUCT = struct.Struct(">xBBBBBxxxBBBBxB")
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,20 +55,26 @@ class SwitchbotKeypadVision(SwitchbotSequenceDevice, SwitchbotEncryptedDevice):
             return None
         _LOGGER.debug("Raw model %s basic info data: %s", self._model, _data.hex())
 
-        battery = _data[1] & 0x7F
-        firmware = _data[2] / 10.0
-        hardware = _data[3]
-        support_fingerprint = _data[4]
-        lock_button_enabled = bool(_data[5] != 1)
-        tamper_alarm_enabled = bool(_data[9])
-        backlight_enabled = bool(_data[10] != 1)
-        backlight_level = _data[11]
-        prompt_tone_enabled = bool(_data[12] != 1)
-
-        if self._model == SwitchbotModel.KEYPAD_VISION:
-            battery_charging = bool((_data[14] & 0x06) >> 1)
-        else:
-            battery_charging = bool((_data[14] & 0x0E) >> 1)
+        (
+            battery,
+            firmware,
+            hardware,
+            support_fingerprint,
+            lock_button,
+            tamper_alarm,
+            backlight,
+            backlight_level,
+            prompt_tone,
+            charging,
+        ) = _BASIC_INFO_STRUCT.unpack_from(_data)
+        battery &= 0x7F
+        firmware /= 10.0
+        lock_button_enabled = lock_button != 1
+        tamper_alarm_enabled = tamper_alarm != 0
+        backlight_enabled = backlight != 1
+        prompt_tone_enabled = prompt_tone != 1
+        charging_mask = 0x06 if self._model == SwitchbotModel.KEYPAD_VISION else 0x0E
+        battery_charging = (charging & charging_mask) != 0
 
         result = {
             "battery": battery,
@@ -81,49 +94,34 @@ class SwitchbotKeypadVision(SwitchbotSequenceDevice, SwitchbotEncryptedDevice):
 
     def _check_password_rules(self, password: str) -> None:
         """Check if the password compliant with the rules."""
-        if not PASSWORD_RE.fullmatch(password):
+        if not (6 <= len(password) <= 12 and password.isascii() and password.isdigit()):
             raise ValueError("Password must be 6-12 digits.")
 
     def _build_password_payload(self, password: str) -> bytes:
         """Build password payload."""
-        pwd_bytes = bytes(int(ch) for ch in password)
-        pwd_length = len(pwd_bytes)
-
-        payload = bytearray()
-        payload.append(0xFF)
-        payload.append(0x00)
-        payload.append(pwd_length)
-        payload.extend(pwd_bytes)
+        pwd_bytes = password.encode("ascii").translate(_DIGIT_VALUES)
+        return bytes((0xFF, 0x00, len(pwd_bytes))) + pwd_bytes
 
-        return bytes(payload)
-
-    def _build_add_password_cmd(self, password: str) -> list[str]:
+    def _build_add_password_cmd(self, password: str) -> list[bytes]:
         """Build command to add a password."""
-        cmd_header = bytes.fromhex("570F520202")
-
-        payload = self._build_password_payload(password)
+        payload = memoryview(self._build_password_payload(password))
 
         max_payload = 11
 
-        chunks = [
-            payload[i : i + max_payload] for i in range(0, len(payload), max_payload)
+        total = (len(payload) + max_payload - 1) // max_payload
+        cmds = [
+            COMMAND_ADD_PASSWORD
+            + bytes((((total & 0x0F) << 4) | (idx & 0x0F),))
+            + payload[idx * max_payload : (idx + 1) * max_payload]
+            for idx in range(total)
         ]
-        total = len(chunks)
-        cmds: list[str] = []
 
-        for idx, chunk in enumerate(chunks):
-            packet_info = ((total & 0x0F) << 4) | (idx & 0x0F)
-
-            cmd = bytearray()
-            cmd.extend(cmd_header)
-            cmd.append(packet_info)
-            cmd.extend(chunk)
-
-            cmds.append(cmd.hex().upper())
-
-        _LOGGER.debug(
-            "device: %s add password commands: %s", self._device.address, cmds
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "device: %s add password commands: %s",
+                self._device.address,
+                [cmd.hex().upper() for cmd in cmds],
+            )
 
         return cmds
 
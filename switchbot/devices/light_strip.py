@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Any
+import struct
+from typing import Any, ClassVar
 
 from ..const import SwitchbotModel
 from ..const.light import (
@@ -9,8 +10,14 @@ from ..const.light import (
     RGBICWWCeilingLightColorMode,
     StripLightColorMode,
 )
+from ..helpers import HEX_BYTE
 from .base_light import SwitchbotSequenceBaseLight
-from .device import SwitchbotEncryptedDevice, update_after_operation
+from .device import COMMAND_SUCCESS, SwitchbotEncryptedDevice, update_after_operation
+
+# r, g, b, color temperature
+_RGB_CW_STRUCT = struct.Struct(">BBBxH")
+# status, brightness, r, g, b, color temperature, color mode
+_BASIC_INFO_STRUCT = struct.Struct(">BBBBBxHxB")
 
 # Private mapping from device-specific color modes to original ColorMode enum
 _STRIP_LIGHT_COLOR_MODE_MAP = {
@@ -41,8 +48,21 @@ _RGBICWW_CEILING_LIGHT_COLOR_MODE_MAP = {
     RGBICWWCeilingLightColorMode.EFFECT: ColorMode.EFFECT,
     RGBICWWCeilingLightColorMode.UNKNOWN: ColorMode.OFF,
 }
+# The same mappings keyed by the raw advertised value, so the color_mode
+# properties resolve with one dict lookup instead of an Enum call plus a lookup.
+_STRIP_LIGHT_COLOR_MODE_BY_VALUE = {
+    mode.value: color_mode for mode, color_mode in _STRIP_LIGHT_COLOR_MODE_MAP.items()
+}
+_RGBICWW_STRIP_LIGHT_COLOR_MODE_BY_VALUE = {
+    mode.value: color_mode
+    for mode, color_mode in _RGBICWW_STRIP_LIGHT_COLOR_MODE_MAP.items()
+}
+_RGBICWW_CEILING_LIGHT_COLOR_MODE_BY_VALUE = {
+    mode.value: color_mode
+    for mode, color_mode in _RGBICWW_CEILING_LIGHT_COLOR_MODE_MAP.items()
+}
 LIGHT_STRIP_CONTROL_HEADER = "570F4901"
-COMMON_EFFECTS = {
+_COMMON_EFFECTS_HEX = {
     "christmas": [
         "570F49070200033C01",
         "570F490701000600009902006D0EFF0021",
@@ -120,7 +140,7 @@ COMMON_EFFECTS = {
         "570F490701000503600C2B35040C",
     ],
 }
-RGBIC_EFFECTS = {
+_RGBIC_EFFECTS_HEX = {
     "romance": [
         "570F490D01350100FF10EE",
         "570F490D0363",
@@ -238,16 +258,33 @@ RGBIC_EFFECTS = {
 }
 
 
+def _effects_to_bytes(effects: dict[str, list[str]]) -> dict[str, list[bytes]]:
+    """Decode the hex effect command lists once at import."""
+    return {
+        name: [bytes.fromhex(cmd) for cmd in cmds] for name, cmds in effects.items()
+    }
+
+
+COMMON_EFFECTS = _effects_to_bytes(_COMMON_EFFECTS_HEX)
+RGBIC_EFFECTS = _effects_to_bytes(_RGBIC_EFFECTS_HEX)
+# Only the decoded tables are used; drop the hex sources instead of keeping
+# both copies of every command resident.
+del _COMMON_EFFECTS_HEX, _RGBIC_EFFECTS_HEX
+
+
 class SwitchbotLightStrip(SwitchbotSequenceBaseLight):
     """Representation of a Switchbot light strip."""
 
     _effect_dict = COMMON_EFFECTS
-    _turn_on_command = f"{LIGHT_STRIP_CONTROL_HEADER}01"
-    _turn_off_command = f"{LIGHT_STRIP_CONTROL_HEADER}02"
+    _turn_on_command = bytes.fromhex(f"{LIGHT_STRIP_CONTROL_HEADER}01")
+    _turn_off_command = bytes.fromhex(f"{LIGHT_STRIP_CONTROL_HEADER}02")
     _set_rgb_command = f"{LIGHT_STRIP_CONTROL_HEADER}12{{}}"
     _set_color_temp_command = f"{LIGHT_STRIP_CONTROL_HEADER}11{{}}"
     _set_brightness_command = f"{LIGHT_STRIP_CONTROL_HEADER}14{{}}"
-    _get_basic_info_command = ["570003", "570f4A01"]
+    _get_basic_info_command = [bytes.fromhex("570003"), bytes.fromhex("570f4A01")]
+    _color_mode_by_value: ClassVar[dict[int, ColorMode]] = (
+        _STRIP_LIGHT_COLOR_MODE_BY_VALUE
+    )
 
     @property
     def color_modes(self) -> set[ColorMode]:
@@ -257,8 +294,9 @@ class SwitchbotLightStrip(SwitchbotSequenceBaseLight):
     @property
     def color_mode(self) -> ColorMode:
         """Return the current color mode."""
-        device_mode = StripLightColorMode(self._get_adv_value("color_mode") or 10)
-        return _STRIP_LIGHT_COLOR_MODE_MAP.get(device_mode, ColorMode.OFF)
+        return self._color_mode_by_value.get(
+            self._get_adv_value("color_mode") or 10, ColorMode.OFF
+        )
 
     async def get_basic_info(self) -> dict[str, Any] | None:
         """Get device basic settings."""
@@ -268,19 +306,19 @@ class SwitchbotLightStrip(SwitchbotSequenceBaseLight):
             return None
 
         _version_info, _data = res
-        self._state["r"] = _data[3]
-        self._state["g"] = _data[4]
-        self._state["b"] = _data[5]
-        self._state["cw"] = int.from_bytes(_data[7:9], "big")
+        status, brightness, r, g, b, cw, color_mode = _BASIC_INFO_STRUCT.unpack_from(
+            _data, 1
+        )
+        self._state.update(r=r, g=g, b=b, cw=cw)
 
         return {
-            "isOn": bool(_data[1] & 0b10000000),
-            "brightness": _data[2] & 0b01111111,
-            "r": self._state["r"],
-            "g": self._state["g"],
-            "b": self._state["b"],
-            "cw": self._state["cw"],
-            "color_mode": _data[10] & 0b00001111,
+            "isOn": bool(status & 0b10000000),
+            "brightness": brightness & 0b01111111,
+            "r": r,
+            "g": g,
+            "b": b,
+            "cw": cw,
+            "color_mode": color_mode & 0b00001111,
             "firmware": _version_info[2] / 10.0,
         }
 
@@ -333,18 +371,13 @@ class SwitchbotRgbicLight(SwitchbotEncryptedDevice, SwitchbotLightStrip):
 
     _model = SwitchbotModel.RGBICWW_STRIP_LIGHT
     _effect_dict = RGBIC_EFFECTS
+    _color_mode_by_value = _RGBICWW_STRIP_LIGHT_COLOR_MODE_BY_VALUE
 
     @property
     def color_modes(self) -> set[ColorMode]:
         """Return the supported color modes."""
         return {ColorMode.RGB, ColorMode.COLOR_TEMP}
 
-    @property
-    def color_mode(self) -> ColorMode:
-        """Return the current color mode."""
-        device_mode = RGBICStripLightColorMode(self._get_adv_value("color_mode") or 10)
-        return _RGBICWW_STRIP_LIGHT_COLOR_MODE_MAP.get(device_mode, ColorMode.OFF)
-
 
 class SwitchbotPermanentOutdoorLight(SwitchbotRgbicLight):
     """Support for Switchbot Permanent Outdoor Light."""
@@ -374,6 +407,7 @@ class SwitchbotRgbicwwCeilingLight(SwitchbotEncryptedDevice, SwitchbotLightStrip
 
     _model = SwitchbotModel.RGBICWW_CEILING_LIGHT
     _effect_dict = RGBIC_EFFECTS
+    _color_mode_by_value = _RGBICWW_CEILING_LIGHT_COLOR_MODE_BY_VALUE
 
     # Color sub-light commands (sub_cmd 0x12 brightness+RGB, 0x14 brightness)
     _set_brightness_command = f"{LIGHT_STRIP_CONTROL_HEADER}14{{}}"
@@ -389,24 +423,16 @@ class SwitchbotRgbicwwCeilingLight(SwitchbotEncryptedDevice, SwitchbotLightStrip
     # let the selector drive the individual sub-lights.
     # selector: bit7=1 (specify), bits[3:2]=color state, bits[1:0]=white state;
     # state encoding 00=keep, 01=on, 02=off, 03=toggle.
-    _turn_on_main_command = f"{LIGHT_STRIP_CONTROL_HEADER}0181"
-    _turn_off_main_command = f"{LIGHT_STRIP_CONTROL_HEADER}0182"
-    _turn_on_color_command = f"{LIGHT_STRIP_CONTROL_HEADER}0184"
-    _turn_off_color_command = f"{LIGHT_STRIP_CONTROL_HEADER}0188"
+    _turn_on_main_command = bytes.fromhex(f"{LIGHT_STRIP_CONTROL_HEADER}0181")
+    _turn_off_main_command = bytes.fromhex(f"{LIGHT_STRIP_CONTROL_HEADER}0182")
+    _turn_on_color_command = bytes.fromhex(f"{LIGHT_STRIP_CONTROL_HEADER}0184")
+    _turn_off_color_command = bytes.fromhex(f"{LIGHT_STRIP_CONTROL_HEADER}0188")
 
     @property
     def color_modes(self) -> set[ColorMode]:
         """Return the supported color modes (color sub-light)."""
         return {ColorMode.RGB, ColorMode.COLOR_TEMP}
 
-    @property
-    def color_mode(self) -> ColorMode:
-        """Return the current color mode."""
-        device_mode = RGBICWWCeilingLightColorMode(
-            self._get_adv_value("color_mode") or 10
-        )
-        return _RGBICWW_CEILING_LIGHT_COLOR_MODE_MAP.get(device_mode, ColorMode.OFF)
-
     @property
     def is_main_on(self) -> bool | None:
         """Return whether the main (warm-white) sub-light is on."""
@@ -421,45 +447,45 @@ class SwitchbotRgbicwwCeilingLight(SwitchbotEncryptedDevice, SwitchbotLightStrip
     async def turn_on_main(self) -> bool:
         """Turn the main (warm-white) sub-light on."""
         result = await self._send_command(self._turn_on_main_command)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def turn_off_main(self) -> bool:
         """Turn the main (warm-white) sub-light off."""
         result = await self._send_command(self._turn_off_main_command)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def turn_on_color(self) -> bool:
         """Turn the color sub-light on."""
         result = await self._send_command(self._turn_on_color_command)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def turn_off_color(self) -> bool:
         """Turn the color sub-light off."""
         result = await self._send_command(self._turn_off_color_command)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def set_main_brightness(self, brightness: int) -> bool:
         """Set the main (warm-white) sub-light brightness (sub_cmd 0x09)."""
         self._validate_brightness(brightness)
-        hex_brightness = f"{brightness:02X}"
+        hex_brightness = HEX_BYTE[brightness]
         result = await self._send_command(
             self._set_main_brightness_command.format(hex_brightness)
         )
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def set_main_color_temp(self, color_temp: int) -> bool:
         """Set the main (warm-white) sub-light color temperature (sub_cmd 0x10)."""
         self._validate_color_temp(color_temp)
-        hex_data = f"{color_temp:04X}"
+        hex_data = HEX_BYTE[color_temp >> 8] + HEX_BYTE[color_temp & 0xFF]
         result = await self._send_command(
             self._set_main_color_temp_command.format(hex_data)
         )
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     async def get_basic_info(self) -> dict[str, Any] | None:
         """
@@ -477,14 +503,12 @@ class SwitchbotRgbicwwCeilingLight(SwitchbotEncryptedDevice, SwitchbotLightStrip
             return None
 
         _version_info, _data = res
-        self._state["r"] = _data[3]
-        self._state["g"] = _data[4]
-        self._state["b"] = _data[5]
-        self._state["cw"] = int.from_bytes(_data[7:9], "big")
+        r, g, b, cw = _RGB_CW_STRUCT.unpack_from(_data, 3)
+        self._state.update(r=r, g=g, b=b, cw=cw)
 
         return {
-            "r": self._state["r"],
-            "g": self._state["g"],
-            "b": self._state["b"],
+            "r": r,
+            "g": g,
+            "b": b,
             "firmware": _version_info[2] / 10.0,
         }
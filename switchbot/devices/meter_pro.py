@@ -1,15 +1,21 @@
+import struct
+from datetime import datetime
 from typing import Any
 
-from ..helpers import parse_uint24_be
-from .device import SwitchbotDevice, SwitchbotOperationError
+from .device import COMMAND_SUCCESS, SwitchbotDevice, SwitchbotOperationError
 
-COMMAND_SET_TIME_OFFSET = "570f680506"
-COMMAND_GET_TIME_OFFSET = "570f690506"
+COMMAND_SET_TIME_OFFSET = bytes.fromhex("570f680506")
+COMMAND_GET_TIME_OFFSET = bytes.fromhex("570f690506")
 MAX_TIME_OFFSET = (1 << 24) - 1
 
-COMMAND_GET_DEVICE_DATETIME = "570f6901"
-COMMAND_SET_DEVICE_DATETIME = "57000503"
-COMMAND_SET_DISPLAY_FORMAT = "570f680505"
+COMMAND_GET_DEVICE_DATETIME = bytes.fromhex("570f6901")
+COMMAND_SET_DEVICE_DATETIME = bytes.fromhex("57000503")
+COMMAND_SET_DISPLAY_FORMAT = bytes.fromhex("570f680505")
+_DISPLAY_FORMAT_12H = COMMAND_SET_DISPLAY_FORMAT + b"\x80"
+_DISPLAY_FORMAT_24H = COMMAND_SET_DISPLAY_FORMAT + b"\x00"
+
+# display format, year, month, day, hour, minute, second
+_DATETIME_STRUCT = struct.Struct(">5xBHBBBBB")
 
 
 class SwitchbotMeterProCO2(SwitchbotDevice):
@@ -31,9 +37,8 @@ class SwitchbotMeterProCO2(SwitchbotDevice):
         result = await self._send_command(COMMAND_GET_TIME_OFFSET)
         result = self._validate_result("get_time_offset", result, min_length=5)
 
-        is_negative = bool(result[1] & 0b10000000)
-        offset = parse_uint24_be(result, 2)
-        return -offset if is_negative else offset
+        offset = int.from_bytes(result[2:5], "big")
+        return -offset if result[1] & 0b10000000 else offset
 
     async def set_time_offset(self, offset_seconds: int) -> None:
         """
@@ -47,16 +52,16 @@ class SwitchbotMeterProCO2(SwitchbotDevice):
             offset_seconds (int): 2^24 maximum, can be negative.
 
         """
-        abs_offset = abs(offset_seconds)
-        if abs_offset > MAX_TIME_OFFSET:
+        if not -MAX_TIME_OFFSET <= offset_seconds <= MAX_TIME_OFFSET:
             raise SwitchbotOperationError(
                 f"{self.name}: Requested to set_time_offset of {offset_seconds} seconds, allowed +-{MAX_TIME_OFFSET} max."
             )
 
-        sign_byte = "80" if offset_seconds < 0 else "00"
+        abs_offset = abs(offset_seconds)
+        sign_byte = b"\x80" if offset_seconds < 0 else b"\x00"
 
         # Example: 57-0f-68-05-06-80-00-10-00 -> subtract 4096 seconds.
-        payload = f"{COMMAND_SET_TIME_OFFSET}{sign_byte}{abs_offset:06x}"
+        payload = COMMAND_SET_TIME_OFFSET + sign_byte + abs_offset.to_bytes(3, "big")
         result = await self._send_command(payload)
         self._validate_result("set_time_offset", result)
 
@@ -77,6 +82,49 @@ class SwitchbotMeterProCO2(SwitchbotDevice):
                 - second (int)
 
         """
+        # Built from the raw fields rather than from get_datetime_as_datetime:
+        # a device whose clock was never set reports year 0, which datetime()
+        # rejects, and this method has always returned those fields as-is.
+        (
+            is_12h_mode,
+            (year, month, day, hour, minute, second),
+        ) = await self._read_datetime("get_datetime")
+        return {
+            # Whether the time is displayed in 12h(am/pm) or 24h mode.
+            "12h_mode": is_12h_mode,
+            "year": year,
+            "month": month,
+            "day": day,
+            "hour": hour,
+            "minute": minute,
+            "second": second,
+        }
+
+    async def get_datetime_as_datetime(self) -> tuple[bool, datetime]:
+        """
+        Get the current device time as it is displayed, as a naive datetime.
+        Contains a time offset, if any was applied (see set_time_offset).
+
+        Returns:
+            tuple: (is_12h, datetime), where is_12h is True if the time is
+                displayed in 12h mode, False if 24h mode.
+
+        Raises:
+            SwitchbotOperationError: If the device clock holds an invalid
+                date, e.g. year 0 when it was never set.
+
+        """
+        is_12h_mode, fields = await self._read_datetime("get_datetime_as_datetime")
+        try:
+            # The device clock carries no time zone (see get_datetime).
+            value = datetime(*fields)  # noqa: DTZ001
+        except ValueError as err:
+            raise SwitchbotOperationError(
+                f"{self.name}: Device reported an invalid datetime {fields}"
+            ) from err
+        return is_12h_mode, value
+
+    async def _read_datetime(self, op_name: str) -> tuple[bool, tuple[int, ...]]:
         # Response Format: 13 bytes, where
         # - byte 0: "01" (success)
         # - bytes 1-4: temperature, ignored here.
@@ -87,17 +135,9 @@ class SwitchbotMeterProCO2(SwitchbotDevice):
         # Example: 01-e4-02-94-23-00-07-e9-0c-1e-08-37-01 contains
         # "year 2025, 30 December, 08:55:01, displayed in 24h format".
         result = await self._send_command(COMMAND_GET_DEVICE_DATETIME)
-        result = self._validate_result("get_datetime", result, min_length=13)
-        return {
-            # Whether the time is displayed in 12h(am/pm) or 24h mode.
-            "12h_mode": bool(result[5] & 0b10000000),
-            "year": (result[6] << 8) + result[7],
-            "month": result[8],
-            "day": result[9],
-            "hour": result[10],
-            "minute": result[11],
-            "second": result[12],
-        }
+        result = self._validate_result(op_name, result, min_length=13)
+        values = _DATETIME_STRUCT.unpack_from(result)
+        return bool(values[0] & 0b10000000), values[1:]
 
     async def set_datetime(
         self, timestamp: int, utc_offset_hours: int = 0, utc_offset_minutes: int = 0
@@ -137,8 +177,10 @@ class SwitchbotMeterProCO2(SwitchbotDevice):
         utc_byte = utc_offset_hours + 12
 
         payload = (
-            f"{COMMAND_SET_DEVICE_DATETIME}{utc_byte:02x}"
-            f"{adjusted_timestamp:016x}{utc_offset_minutes:02x}"
+            COMMAND_SET_DEVICE_DATETIME
+            + bytes((utc_byte,))
+            + adjusted_timestamp.to_bytes(8, "big")
+            + bytes((utc_offset_minutes,))
         )
 
         result = await self._send_command(payload)
@@ -152,15 +194,14 @@ class SwitchbotMeterProCO2(SwitchbotDevice):
             is_12h_mode (bool): True for 12h (AM/PM) mode, False for 24h mode.
 
         """
-        mode_byte = "80" if is_12h_mode else "00"
-        payload = f"{COMMAND_SET_DISPLAY_FORMAT}{mode_byte}"
+        payload = _DISPLAY_FORMAT_12H if is_12h_mode else _DISPLAY_FORMAT_24H
         result = await self._send_command(payload)
         self._validate_result("set_time_display_format", result)
 
     def _validate_result(
         self, op_name: str, result: bytes | None, min_length: int | None = None
     ) -> bytes:
-        if not self._check_command_result(result, 0, {1}):
+        if not self._check_command_result(result, 0, COMMAND_SUCCESS):
             raise SwitchbotOperationError(
                 f"{self.name}: Unexpected response code for {op_name} (result={result.hex() if result else 'None'} rssi={self.rssi})"
             )
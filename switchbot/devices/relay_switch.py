@@ -1,11 +1,12 @@
 import logging
+import struct
 import time
 from typing import Any
 
 from ..const import SwitchbotModel
-from ..helpers import parse_power_data, parse_uint24_be
 from ..models import SwitchBotAdvertisement
 from .device import (
+    COMMAND_SUCCESS,
     SwitchbotEncryptedDevice,
     SwitchbotSequenceDevice,
     update_after_operation,
@@ -18,32 +19,51 @@ SWITCH1_ON_MASK = 0b10000000
 SWITCH2_ON_MASK = 0b01000000
 DOOR_OPEN_MASK = 0b00100000
 
+# Power fields carried over from the previous advertisement
+_POWER_FIELDS = ("voltage", "current", "power", "energy")
+
+# Models with and without power metering
+_POWER_METERING_MODELS = frozenset(
+    {
+        SwitchbotModel.RELAY_SWITCH_1PM,
+        SwitchbotModel.RELAY_SWITCH_2PM,
+        SwitchbotModel.PLUG_MINI_EU,
+    }
+)
+_NON_METERING_MODELS = frozenset(
+    {SwitchbotModel.RELAY_SWITCH_1, SwitchbotModel.GARAGE_DOOR_OPENER}
+)
+
 COMMAND_HEADER = "57"
 COMMAND_CONTROL = "570f70"
-COMMAND_TOGGLE = f"{COMMAND_CONTROL}010200"
-COMMAND_GET_VOLTAGE_AND_CURRENT = f"{COMMAND_HEADER}0f7106000000"
+COMMAND_TOGGLE = bytes.fromhex(f"{COMMAND_CONTROL}010200")
+COMMAND_GET_VOLTAGE_AND_CURRENT = bytes.fromhex(f"{COMMAND_HEADER}0f7106000000")
 
-COMMAND_GET_BASIC_INFO = f"{COMMAND_HEADER}0f7181"
-COMMAND_GET_CHANNEL1_INFO = f"{COMMAND_HEADER}0f710600{{}}{{}}"
-COMMAND_GET_CHANNEL2_INFO = f"{COMMAND_HEADER}0f710601{{}}{{}}"
+COMMAND_GET_BASIC_INFO = bytes.fromhex(f"{COMMAND_HEADER}0f7181")
+# followed by packed current time and start of day (_TIME_STRUCT)
+COMMAND_GET_CHANNEL1_INFO = bytes.fromhex(f"{COMMAND_HEADER}0f710600")
+COMMAND_GET_CHANNEL2_INFO = bytes.fromhex(f"{COMMAND_HEADER}0f710601")
+_TIME_STRUCT = struct.Struct(">II")
+# energy (24 bit), energy usage yesterday (24 bit), use time, voltage, current, power
+_USER_DATA_STRUCT = struct.Struct(">xBHBHHHHH")
 
 
 MULTI_CHANNEL_COMMANDS_TURN_ON = {
     SwitchbotModel.RELAY_SWITCH_2PM: {
-        1: "570f70010d00",
-        2: "570f70010700",
+        1: bytes.fromhex("570f70010d00"),
+        2: bytes.fromhex("570f70010700"),
     }
 }
 MULTI_CHANNEL_COMMANDS_TURN_OFF = {
     SwitchbotModel.RELAY_SWITCH_2PM: {
-        1: "570f70010c00",
-        2: "570f70010300",
+        1: bytes.fromhex("570f70010c00"),
+        2: bytes.fromhex("570f70010300"),
     }
 }
 MULTI_CHANNEL_COMMANDS_TOGGLE = {
     SwitchbotModel.RELAY_SWITCH_2PM: {
-        1: "570f70010e00",
-        2: "570f70010b00",
+        1: bytes.fromhex("570f70010e00"),
+        2: bytes.fromhex("570f70010b00"),
     }
 }
 MULTI_CHANNEL_COMMANDS_GET_VOLTAGE_AND_CURRENT = {
@@ -58,8 +78,9 @@ class SwitchbotRelaySwitch(SwitchbotSequenceDevice, SwitchbotEncryptedDevice):
     """Representation of a Switchbot relay switch 1pm."""
 
     _model = SwitchbotModel.RELAY_SWITCH_1PM
-    _turn_on_command = f"{COMMAND_CONTROL}010100"
-    _turn_off_command = f"{COMMAND_CONTROL}010000"
+    _channel: int | None = None
+    _turn_on_command = bytes.fromhex(f"{COMMAND_CONTROL}010100")
+    _turn_off_command = bytes.fromhex(f"{COMMAND_CONTROL}010000")
 
     def _reset_power_data(self, data: dict[str, Any]) -> None:
         """Reset power-related data to 0."""
@@ -77,12 +98,22 @@ class SwitchbotRelaySwitch(SwitchbotSequenceDevice, SwitchbotEncryptedDevice):
 
     def _parse_user_data(self, raw_data: bytes) -> dict[str, Any]:
         """Parse user-specific data from raw bytes."""
-        _energy = parse_uint24_be(raw_data, 1) / 60000
-        _energy_usage_yesterday = parse_uint24_be(raw_data, 4) / 60000
-        _use_time = parse_power_data(raw_data, 7, 60.0)
-        _voltage = parse_power_data(raw_data, 9, 10.0)
-        _current = parse_power_data(raw_data, 11, 1000.0)
-        _power = parse_power_data(raw_data, 13, 10.0)
+        (
+            energy_high,
+            energy_low,
+            yesterday_high,
+            yesterday_low,
+            use_time,
+            voltage,
+            current,
+            power,
+        ) = _USER_DATA_STRUCT.unpack_from(raw_data)
+        _energy = ((energy_high << 16) | energy_low) / 60000
+        _energy_usage_yesterday = ((yesterday_high << 16) | yesterday_low) / 60000
+        _use_time = use_time / 60.0
+        _voltage = voltage / 10.0
+        _current = current / 1000.0
+        _power = power / 10.0
 
         return {
             "energy": 0.01 if 0 < _energy <= 0.01 else round(_energy, 2),
@@ -98,41 +129,33 @@ class SwitchbotRelaySwitch(SwitchbotSequenceDevice, SwitchbotEncryptedDevice):
     def update_from_advertisement(self, advertisement: SwitchBotAdvertisement) -> None:
         """Update device data from advertisement."""
         adv_data = advertisement.data["data"]
-        channel = self._channel if hasattr(self, "_channel") else None
+        channel = self._channel
 
-        if self._model in (
-            SwitchbotModel.RELAY_SWITCH_1PM,
-            SwitchbotModel.RELAY_SWITCH_2PM,
-            SwitchbotModel.PLUG_MINI_EU,
-        ):
+        if self._model in _POWER_METERING_MODELS:
+            get_adv_value = self._get_adv_value
             if channel is None:
-                adv_data["voltage"] = self._get_adv_value("voltage") or 0
-                adv_data["current"] = self._get_adv_value("current") or 0
-                adv_data["power"] = self._get_adv_value("power") or 0
-                adv_data["energy"] = self._get_adv_value("energy") or 0
+                for key in _POWER_FIELDS:
+                    adv_data[key] = get_adv_value(key) or 0
             else:
                 for i in range(1, channel + 1):
-                    adv_data[i] = adv_data.get(i, {})
-                    adv_data[i]["voltage"] = self._get_adv_value("voltage", i) or 0
-                    adv_data[i]["current"] = self._get_adv_value("current", i) or 0
-                    adv_data[i]["power"] = self._get_adv_value("power", i) or 0
-                    adv_data[i]["energy"] = self._get_adv_value("energy", i) or 0
+                    channel_data = adv_data.setdefault(i, {})
+                    for key in _POWER_FIELDS:
+                        channel_data[key] = get_adv_value(key, i) or 0
         super().update_from_advertisement(advertisement)
 
-    def get_current_time_and_start_time(self) -> int:
-        """Get current time in seconds since epoch."""
+    def _current_time_and_start_time(self) -> tuple[int, int]:
+        """Get current time and start of the current day in seconds since epoch."""
         current_time = int(time.time())
-        current_time_hex = f"{current_time:08x}"
-        current_day_start_time = int(current_time / 86400) * 86400
-        current_day_start_time_hex = f"{current_day_start_time:08x}"
+        return current_time, current_time - current_time % 86400
 
-        return current_time_hex, current_day_start_time_hex
+    def get_current_time_and_start_time(self) -> tuple[str, str]:
+        """Get current time and start of the current day as 8-digit hex strings."""
+        current_time, current_day_start_time = self._current_time_and_start_time()
+        return f"{current_time:08x}", f"{current_day_start_time:08x}"
 
     async def get_basic_info(self) -> dict[str, Any] | None:
         """Get device basic settings."""
-        current_time_hex, current_day_start_time_hex = (
-            self.get_current_time_and_start_time()
-        )
+        time_data = _TIME_STRUCT.pack(*self._current_time_and_start_time())
 
         if not (_data := await self._get_basic_info(COMMAND_GET_BASIC_INFO)):
             return None
@@ -146,9 +169,7 @@ class SwitchbotRelaySwitch(SwitchbotSequenceDevice, SwitchbotEncryptedDevice):
             return None
         if not (
             _channel1_data := await self._get_basic_info(
-                COMMAND_GET_CHANNEL1_INFO.format(
-                    current_time_hex, current_day_start_time_hex
-                )
+                COMMAND_GET_CHANNEL1_INFO + time_data
             )
         ):
             return None
@@ -166,31 +187,31 @@ class SwitchbotRelaySwitch(SwitchbotSequenceDevice, SwitchbotEncryptedDevice):
         )
 
         common_data = self._parse_common_data(_data)
+
+        if self._model == SwitchbotModel.GARAGE_DOOR_OPENER:
+            _LOGGER.debug("common_data: %s", common_data)
+            common_data["door_open"] = not _data[2] & DOOR_OPEN_MASK
+            return common_data
+
         user_data = self._parse_user_data(_channel1_data)
 
-        if self._model in (
-            SwitchbotModel.RELAY_SWITCH_1,
-            SwitchbotModel.GARAGE_DOOR_OPENER,
-        ):
-            for key in ["voltage", "current", "power", "energy"]:
-                user_data.pop(key, None)
+        if self._model in _NON_METERING_MODELS:
+            for key in _POWER_FIELDS:
+                del user_data[key]
 
         if not common_data["isOn"]:
             self._reset_power_data(user_data)
 
-        garage_door_opener_data = {"door_open": not bool(_data[2] & DOOR_OPEN_MASK)}
-
         _LOGGER.debug("common_data: %s, user_data: %s", common_data, user_data)
 
-        if self._model == SwitchbotModel.GARAGE_DOOR_OPENER:
-            return common_data | garage_door_opener_data
-        return common_data | user_data
+        common_data.update(user_data)
+        return common_data
 
     @update_after_operation
     async def async_toggle(self, **kwargs) -> bool:
         """Toggle device."""
         result = await self._send_command(COMMAND_TOGGLE)
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     def is_on(self) -> bool | None:
         """Return switch state from cache."""
@@ -205,9 +226,10 @@ class SwitchbotGarageDoorOpener(SwitchbotRelaySwitch):
     """Representation of a Switchbot garage door opener."""
 
     _model = SwitchbotModel.GARAGE_DOOR_OPENER
-    _open_command = f"{COMMAND_CONTROL}110129"
-    _close_command = f"{COMMAND_CONTROL}110229"
-    _press_command = f"{COMMAND_CONTROL}110329"  # for garage door opener toggle
+    _open_command = bytes.fromhex(f"{COMMAND_CONTROL}110129")
+    _close_command = bytes.fromhex(f"{COMMAND_CONTROL}110229")
+    # for garage door opener toggle
+    _press_command = bytes.fromhex(f"{COMMAND_CONTROL}110329")
 
 
 class SwitchbotRelaySwitch2PM(SwitchbotRelaySwitch):
@@ -226,16 +248,12 @@ class SwitchbotRelaySwitch2PM(SwitchbotRelaySwitch):
         return data.get(channel, {})
 
     async def get_basic_info(self):
-        current_time_hex, current_day_start_time_hex = (
-            self.get_current_time_and_start_time()
-        )
+        time_data = _TIME_STRUCT.pack(*self._current_time_and_start_time())
         if not (common_data := await super().get_basic_info()):
             return None
         if not (
             _channel2_data := await self._get_basic_info(
-                COMMAND_GET_CHANNEL2_INFO.format(
-                    current_time_hex, current_day_start_time_hex
-                )
+                COMMAND_GET_CHANNEL2_INFO + time_data
             )
         ):
             return None
@@ -267,7 +285,7 @@ class SwitchbotRelaySwitch2PM(SwitchbotRelaySwitch):
         result = await self._send_command(
             MULTI_CHANNEL_COMMANDS_TURN_ON[self._model][channel]
         )
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def turn_off(self, channel: int) -> bool:
@@ -275,7 +293,7 @@ class SwitchbotRelaySwitch2PM(SwitchbotRelaySwitch):
         result = await self._send_command(
             MULTI_CHANNEL_COMMANDS_TURN_OFF[self._model][channel]
         )
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     @update_after_operation
     async def async_toggle(self, channel: int) -> bool:
@@ -283,7 +301,7 @@ class SwitchbotRelaySwitch2PM(SwitchbotRelaySwitch):
         result = await self._send_command(
             MULTI_CHANNEL_COMMANDS_TOGGLE[self._model][channel]
         )
-        return self._check_command_result(result, 0, {1})
+        return self._check_command_result(result, 0, COMMAND_SUCCESS)
 
     def is_on(self, channel: int) -> bool | None:
         """Return switch state from cache."""
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import struct
 import warnings
 from typing import Any
 
@@ -14,18 +15,21 @@ _LOGGER = logging.getLogger(__name__)
 
 
 OPEN_KEYS = [
-    f"{REQ_HEADER}{ROLLERSHADE_COMMAND}01{CONTROL_SOURCE}0100",
-    f"{REQ_HEADER}{ROLLERSHADE_COMMAND}05{CONTROL_SOURCE}",  # +mode + "00"
+    bytes.fromhex(f"{REQ_HEADER}{ROLLERSHADE_COMMAND}01{CONTROL_SOURCE}0100"),
+    bytes.fromhex(f"{REQ_HEADER}{ROLLERSHADE_COMMAND}05{CONTROL_SOURCE}"),  # +mode + 00
 ]
 CLOSE_KEYS = [
-    f"{REQ_HEADER}{ROLLERSHADE_COMMAND}01{CONTROL_SOURCE}0164",
-    f"{REQ_HEADER}{ROLLERSHADE_COMMAND}05{CONTROL_SOURCE}",  # +mode + "64"
+    bytes.fromhex(f"{REQ_HEADER}{ROLLERSHADE_COMMAND}01{CONTROL_SOURCE}0164"),
+    bytes.fromhex(f"{REQ_HEADER}{ROLLERSHADE_COMMAND}05{CONTROL_SOURCE}"),  # +mode + 64
 ]
 POSITION_KEYS = [
-    f"{REQ_HEADER}{ROLLERSHADE_COMMAND}01{CONTROL_SOURCE}01",
-    f"{REQ_HEADER}{ROLLERSHADE_COMMAND}05{CONTROL_SOURCE}",
+    bytes.fromhex(f"{REQ_HEADER}{ROLLERSHADE_COMMAND}01{CONTROL_SOURCE}01"),
+    bytes.fromhex(f"{REQ_HEADER}{ROLLERSHADE_COMMAND}05{CONTROL_SOURCE}"),
 ]  # +actual_position
-STOP_KEYS = [f"{REQ_HEADER}{ROLLERSHADE_COMMAND}00{CONTROL_SOURCE}01"]
+STOP_KEYS = [bytes.fromhex(f"{REQ_HEADER}{ROLLERSHADE_COMMAND}00{CONTROL_SOURCE}01")]
+
+# battery, firmware, chain length, status, position, timers
+_BASIC_INFO_STRUCT = struct.Struct(">xBBBBBB")
 
 
 class SwitchbotRollerShade(SwitchbotBaseCover, SwitchbotSequenceDevice):
@@ -60,7 +64,7 @@ class SwitchbotRollerShade(SwitchbotBaseCover, SwitchbotSequenceDevice):
         """Send open command. 0 - performance mode, 1 - quiet mode."""
         self._validate_mode(mode)
         if success := await self._send_multiple_commands(
-            [OPEN_KEYS[0], f"{OPEN_KEYS[1]}{mode:02X}00"]
+            [OPEN_KEYS[0], OPEN_KEYS[1] + bytes((mode, 0x00))]
         ):
             self._is_opening = True
             self._is_closing = False
@@ -89,7 +93,7 @@ class SwitchbotRollerShade(SwitchbotBaseCover, SwitchbotSequenceDevice):
             )
         self._validate_mode(mode)
         if success := await self._send_multiple_commands(
-            [CLOSE_KEYS[0], f"{CLOSE_KEYS[1]}{mode:02X}64"]
+            [CLOSE_KEYS[0], CLOSE_KEYS[1] + bytes((mode, 0x64))]
         ):
             self._is_closing = True
             self._is_opening = False
@@ -109,8 +113,8 @@ class SwitchbotRollerShade(SwitchbotBaseCover, SwitchbotSequenceDevice):
         position = (100 - position) if self._reverse else position
         if success := await self._send_multiple_commands(
             [
-                f"{POSITION_KEYS[0]}{position:02X}",
-                f"{POSITION_KEYS[1]}{mode:02X}{position:02X}",
+                POSITION_KEYS[0] + bytes((position,)),
+                POSITION_KEYS[1] + bytes((mode, position)),
             ]
         ):
             self._update_motion_direction(
@@ -128,28 +132,29 @@ class SwitchbotRollerShade(SwitchbotBaseCover, SwitchbotSequenceDevice):
         if not (_data := await self._get_basic_info()):
             return None
 
-        _position = max(min(_data[5], 100), 0)
+        battery, firmware, chain_length, status, position, timers = (
+            _BASIC_INFO_STRUCT.unpack_from(_data)
+        )
+        _position = min(position, 100)
         _direction_adjusted_position = (100 - _position) if self._reverse else _position
         _previous_position = self._get_adv_value("position")
-        _in_motion = bool(_data[4] & 0b00000011)
+        _in_motion = bool(status & 0b00000011)
         self._update_motion_direction(
             _in_motion, _previous_position, _direction_adjusted_position
         )
 
         return {
-            "battery": _data[1],
-            "firmware": _data[2] / 10.0,
-            "chainLength": _data[3],
-            "openDirection": (
-                "clockwise" if _data[4] & 0b10000000 == 128 else "anticlockwise"
-            ),
-            "fault": bool(_data[4] & 0b00010000),
-            "solarPanel": bool(_data[4] & 0b00001000),
-            "calibration": bool(_data[4] & 0b00000100),
-            "calibrated": bool(_data[4] & 0b00000100),
+            "battery": battery,
+            "firmware": firmware / 10.0,
+            "chainLength": chain_length,
+            "openDirection": "clockwise" if status & 0b10000000 else "anticlockwise",
+            "fault": bool(status & 0b00010000),
+            "solarPanel": bool(status & 0b00001000),
+            "calibration": bool(status & 0b00000100),
+            "calibrated": bool(status & 0b00000100),
             "inMotion": _in_motion,
             "position": _direction_adjusted_position,
-            "timers": _data[6],
+            "timers": timers,
         }
 
     def _update_motion_direction(
@@ -13,6 +13,9 @@ _BACKGROUND_TASKS: set[asyncio.Task[Any]] = set()
 _UNPACK_UINT16_BE = struct.Struct(">H").unpack_from  # Big-endian unsigned 16-bit
 _UNPACK_UINT24_BE = struct.Struct(">I").unpack  # For 3-byte values (read as 4 bytes)
 
+# Uppercase two-digit hex for every byte value, for building hex commands
+HEX_BYTE: tuple[str, ...] = tuple(f"{i:02X}" for i in range(256))
+
 
 def create_background_task(target: Coroutine[Any, Any, _R]) -> asyncio.Task[_R]:
     """Create a background task."""
@@ -56,7 +56,9 @@ def make_advertisement_data(
 async def test_open():
     blind_device = create_device_for_command_testing()
     await blind_device.open()
-    blind_device._send_multiple_commands.assert_awaited_once_with(blind_tilt.OPEN_KEYS)
+    blind_device._send_multiple_commands.assert_awaited_once_with(
+        blind_tilt.OPEN_KEYS, stop_on_success=True
+    )
 
 
 @pytest.mark.asyncio
@@ -67,7 +69,43 @@ async def test_open():
 async def test_close(position, keys):
     blind_device = create_device_for_command_testing(position=position)
     await blind_device.close()
-    blind_device._send_multiple_commands.assert_awaited_once_with(keys)
+    blind_device._send_multiple_commands.assert_awaited_once_with(
+        keys, stop_on_success=True
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("responses", "final_result"),
+    [
+        ([b"\x01"], True),
+        ([b"\x00", b"\x01"], True),
+        ([b"\x00", b"\x00"], False),
+    ],
+)
+async def test_open_stops_at_first_success(responses, final_result):
+    ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    blind_device = blind_tilt.SwitchbotBlindTilt(ble_device)
+    blind_device._send_command = AsyncMock(side_effect=responses)
+    blind_device.update = AsyncMock()
+
+    assert await blind_device.open() is final_result
+    assert blind_device._send_command.await_count == len(responses)
+
+
+@pytest.mark.asyncio
+async def test_stop_and_set_position_send_all_commands():
+    ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    blind_device = blind_tilt.SwitchbotBlindTilt(ble_device)
+    blind_device._send_command = AsyncMock(return_value=b"\x01")
+    blind_device.update = AsyncMock()
+
+    assert await blind_device.stop() is True
+    assert blind_device._send_command.await_count == 2
+
+    blind_device._send_command.reset_mock()
+    assert await blind_device.set_position(50) is True
+    assert blind_device._send_command.await_count == 2
 
 
 @pytest.mark.asyncio
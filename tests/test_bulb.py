@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -75,6 +76,23 @@ async def test_default_info():
     assert device.get_effect_list == ["colorful", "flickering", "breathing"]
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("adv_value", "expected_color_mode"),
+    [
+        (1, ColorMode.COLOR_TEMP),
+        (2, ColorMode.RGB),
+        (3, ColorMode.EFFECT),
+        (5, ColorMode.OFF),
+        (0, ColorMode.OFF),
+    ],
+)
+async def test_color_mode(adv_value, expected_color_mode):
+    """Test mapping the advertised color mode."""
+    device = create_device_for_command_testing({"color_mode": adv_value})
+    assert device.color_mode == expected_color_mode
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("basic_info", "version_info"), [(True, False), (False, True), (False, False)]
@@ -188,7 +206,9 @@ async def test_set_rgb():
 
     await device.set_rgb(100, 255, 128, 64)
 
-    device._send_command.assert_called_with(device._set_rgb_command.format("64FF8040"))
+    device._send_command.assert_called_with(
+        bytes.fromhex(device._set_rgb_command.format("64FF8040"))
+    )
 
 
 @pytest.mark.asyncio
@@ -209,7 +229,7 @@ async def test_set_effect_with_valid_effect():
 
     await device.set_effect("colorful")
 
-    device._send_command.assert_called_with(device._effect_dict["colorful"][0])
+    device._send_command.assert_called_with(bytes.fromhex("570F4701010300"))
 
     assert device.get_effect() == "colorful"
 
@@ -239,3 +259,31 @@ async def test_set_effect_normalizes_case():
         # Should always work regardless of case
         device._send_command.assert_called()
         assert device.get_effect() == test_effect  # Stored as provided
+
+
+@pytest.mark.asyncio
+async def test_sequence_changes_coalesce_into_one_update():
+    """Test that sequence changes during an in-flight update are coalesced."""
+    ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    device = bulb.SwitchbotBulb(ble_device)
+    release = asyncio.Event()
+    update_calls = 0
+
+    async def _update() -> None:
+        nonlocal update_calls
+        update_calls += 1
+        await release.wait()
+
+    device.update = _update
+    device.update_from_advertisement(make_advertisement_data(ble_device))
+    await asyncio.sleep(0)
+    for sequence_number in range(3, 6):
+        device.update_from_advertisement(
+            make_advertisement_data(ble_device, {"sequence_number": sequence_number})
+        )
+    await asyncio.sleep(0)
+    assert update_calls == 1
+
+    release.set()
+    await device._update_task
+    assert update_calls == 2
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import aiohttp
 import pytest
+from bleak.exc import BleakError
 
 from switchbot import fetch_cloud_devices
 from switchbot.adv_parser import _MODEL_TO_MAC_CACHE, populate_model_to_mac_cache
@@ -440,3 +442,238 @@ def test_update_parsed_data_without_advertisement_does_not_log_exception(
     ]
     assert exception_records == []
     assert all(record.exc_info is None for record in caplog.records)
+
+
+@pytest.mark.asyncio
+async def test_update_after_operation_reuses_connection() -> None:
+    """The post-operation refresh rides on the connection opened by the command."""
+    ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    device = SwitchbotDevice(ble_device)
+    device._turn_on_command = "570101"
+
+    client = MagicMock()
+    client.is_connected = True
+    client.start_notify = AsyncMock()
+    client.write_gatt_char = AsyncMock(
+        side_effect=lambda *_: device._notification_handler(0, bytearray(b"\x01d\x0a"))
+    )
+
+    with patch(
+        "switchbot.devices.device.establish_connection", return_value=client
+    ) as mock_establish_connection:
+        assert await device.turn_on() is True
+
+    mock_establish_connection.assert_awaited_once()
+    client.start_notify.assert_awaited_once()
+    client.stop_notify.assert_not_called()
+    assert client.write_gatt_char.await_count == 2
+    device._cancel_disconnect_timer()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("password", [None, "secret"])
+async def test_send_command_accepts_bytes(password: str | None) -> None:
+    """Raw bytes commands go on the wire exactly like their hex-string form."""
+    ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    device = SwitchbotDevice(ble_device, password=password)
+    device._send_command_locked_with_retry = AsyncMock(return_value=b"\x01")
+
+    await device._send_command("570f4301")
+    await device._send_command(bytes.fromhex("570f4301"))
+
+    hex_call, bytes_call = device._send_command_locked_with_retry.await_args_list
+    assert bytes(hex_call.args[1]) == bytes_call.args[1]
+
+
+def test_resolve_characteristics_reuses_same_services_collection() -> None:
+    """Characteristics are looked up again only for a new services collection."""
+    ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    device = SwitchbotDevice(ble_device)
+    services = MagicMock()
+
+    device._resolve_characteristics(services)
+    device._read_char = device._write_char = None
+    device._resolve_characteristics(services)
+
+    assert services.get_characteristic.call_count == 2
+    assert device._read_char is services.get_characteristic.return_value
+    assert device._write_char is services.get_characteristic.return_value
+
+    device._resolve_characteristics(MagicMock())
+    assert device._read_char is not services.get_characteristic.return_value
+
+
+def test_init_outside_event_loop_does_not_touch_loop() -> None:
+    """Devices can be built from sync code; the loop is only looked up when used."""
+    ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    with (
+        patch("asyncio.get_event_loop", side_effect=AssertionError) as get_loop,
+        patch("asyncio.get_running_loop", side_effect=AssertionError) as running,
+    ):
+        SwitchbotDevice(ble_device)
+    get_loop.assert_not_called()
+    running.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_reset_disconnect_timer_moves_deadline_without_rescheduling() -> None:
+    """Repeated resets keep one timer handle and only push the deadline out."""
+    ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    device = SwitchbotDevice(ble_device)
+    device._reset_disconnect_timer()
+    timer = device._disconnect_timer
+    first_deadline = device._disconnect_at
+
+    await asyncio.sleep(0.01)
+    device._reset_disconnect_timer()
+    assert device._disconnect_timer is timer
+    assert device._disconnect_at > first_deadline
+
+    # Firing before the deadline re-arms instead of disconnecting.
+    with patch.object(device, "_execute_timed_disconnect") as mock_disconnect:
+        device._disconnect_from_timer()
+    mock_disconnect.assert_not_called()
+    assert device._disconnect_timer is not None
+    assert device._disconnect_timer.when() == device._disconnect_at
+    timer.cancel()
+    device._cancel_disconnect_timer()
+
+
+@pytest.mark.asyncio
+async def test_send_command_retries_bleak_errors() -> None:
+    """Transient bleak errors are retried until an attempt succeeds."""
+    ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    device = SwitchbotDevice(ble_device)
+    device._send_command_locked = AsyncMock(
+        side_effect=[BleakError("transient"), b"\x01"]
+    )
+
+    assert await device._send_command("570100", retry=1) == b"\x01"
+    assert device._send_command_locked.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_send_command_raises_bleak_error_when_retries_exhausted() -> None:
+    """The last bleak error propagates once the retry budget is spent."""
+    ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    device = SwitchbotDevice(ble_device)
+    device._send_command_locked = AsyncMock(side_effect=BleakError("down"))
+
+    with pytest.raises(BleakError):
+        await device._send_command("570100", retry=1)
+    assert device._send_command_locked.await_count == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("response", [b"\x07", b"\x00", bytearray(b"\x07")])
+async def test_get_basic_info_rejects_failure_codes(response: bytes) -> None:
+    """Single-byte failure replies are rejected, including raw notify bytearrays."""
+    ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    device = SwitchbotDevice(ble_device)
+    device._send_command = AsyncMock(return_value=response)
+
+    assert await device._get_basic_info() is None
+
+
+@pytest.mark.asyncio
+async def test_notify_subscription_completes_before_first_write() -> None:
+    """The command is only written once the reply characteristic is subscribed."""
+    ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    device = SwitchbotDevice(ble_device)
+    calls: list[str] = []
+
+    async def _start_notify(*_: Any) -> None:
+        await asyncio.sleep(0)
+        calls.append("start_notify")
+
+    async def _write(*_: Any) -> None:
+        calls.append("write")
+        device._notification_handler(0, bytearray(b"\x01"))
+
+    client = MagicMock()
+    client.is_connected = True
+    client.start_notify = _start_notify
+    client.write_gatt_char = _write
+
+    with patch("switchbot.devices.device.establish_connection", return_value=client):
+        assert await device._send_command("570100") == b"\x01"
+
+    assert calls == ["start_notify", "write"]
+    device._cancel_disconnect_timer()
+
+
+@pytest.mark.asyncio
+async def test_multiple_commands_wait_for_each_reply() -> None:
+    """Each packet is written only after the previous one has been answered."""
+    ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    device = SwitchbotDevice(ble_device)
+    calls: list[str] = []
+
+    def _reply(packet: bytes) -> None:
+        calls.append(f"reply {packet.hex()}")
+        device._notification_handler(0, bytearray(b"\x01"))
+
+    async def _write(_char: Any, packet: bytes, _response: bool) -> None:
+        calls.append(f"write {packet.hex()}")
+        asyncio.get_running_loop().call_soon(_reply, packet)
+
+    client = MagicMock()
+    client.is_connected = True
+    client.start_notify = AsyncMock()
+    client.write_gatt_char = _write
+
+    with patch("switchbot.devices.device.establish_connection", return_value=client):
+        assert await device._send_multiple_commands([b"\x57\x01", b"\x57\x02"])
+
+    assert calls == ["write 5701", "reply 5701", "write 5702", "reply 5702"]
+    device._cancel_disconnect_timer()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("reply", "message"),
+    [
+        (b"\x07", "Password required"),
+        (b"\x09", "Password incorrect"),
+        (b"\x07\x01", None),
+        (b"\x01", None),
+    ],
+)
+async def test_execute_command_logs_password_errors(
+    caplog: pytest.LogCaptureFixture, reply: bytes, message: str | None
+) -> None:
+    """Only single-byte password status replies are reported as errors."""
+    ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    device = SwitchbotDevice(ble_device)
+    device._client = MagicMock()
+    device._read_char = MagicMock()
+    device._write_char = MagicMock()
+    device._client.write_gatt_char = AsyncMock(
+        side_effect=lambda *_: device._notification_handler(0, bytearray(reply))
+    )
+
+    with caplog.at_level(logging.ERROR):
+        assert await device._execute_command_locked("570100", b"\x57\x01\x00") == reply
+
+    errors = [r.getMessage() for r in caplog.records if r.levelno == logging.ERROR]
+    assert errors == ([message] if message else [])
+
+
+@pytest.mark.asyncio
+async def test_execute_command_logs_written_frame_as_hex(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """The debug log shows the written frame as hex, even for bytes keys."""
+    ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    device = SwitchbotDevice(ble_device)
+    device._client = MagicMock()
+    device._read_char = MagicMock()
+    device._write_char = MagicMock()
+    device._client.write_gatt_char = AsyncMock(
+        side_effect=lambda *_: device._notification_handler(0, bytearray(b"\x01"))
+    )
+
+    with caplog.at_level(logging.DEBUG):
+        await device._execute_command_locked(b"\x57\x0f\x01", b"\x57\x0f\x01")
+
+    assert "Sending command: 570f01" in caplog.text
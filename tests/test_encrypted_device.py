@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 from bleak.exc import BleakDBusError
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
 from switchbot import SwitchbotModel
 from switchbot.devices.device import AESMode, SwitchbotEncryptedDevice
@@ -99,6 +100,19 @@ async def test_send_command_unencrypted() -> None:
         assert call_args[0] == "570000000200"  # Original key with zeros inserted
 
 
+@pytest.mark.asyncio
+async def test_send_command_unencrypted_bytes() -> None:
+    """Test sending an unencrypted raw bytes command."""
+    device = create_encrypted_device()
+
+    with patch.object(device, "_send_command_locked_with_retry") as mock_send:
+        mock_send.return_value = b"\x01\x00\x00\x00"
+
+        await device._send_command(b"\x57\x02\x00", encrypt=False)
+
+        assert mock_send.call_args[0][1] == bytes.fromhex("570000000200")
+
+
 @pytest.mark.asyncio
 async def test_send_command_encrypted_success() -> None:
     """Test successful encrypted command."""
@@ -138,10 +152,7 @@ async def test_send_command_iv_already_initialized() -> None:
         patch.object(device, "_encrypt") as mock_encrypt,
         patch.object(device, "_decrypt") as mock_decrypt,
     ):
-        mock_encrypt.return_value = (
-            "656e637279707465645f64617461",  # "encrypted_data" in hex
-            "abcd",
-        )
+        mock_encrypt.return_value = (b"encrypted_data", b"\xab\xcd")
         mock_decrypt.return_value = b"decrypted_response"
         mock_send.return_value = b"\x01\x00\x00\x00encrypted_response"
 
@@ -154,6 +165,23 @@ async def test_send_command_iv_already_initialized() -> None:
         mock_decrypt.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_send_command_encrypted_bytes_matches_hex() -> None:
+    """Test a raw bytes command encrypts to the same frame as its hex form."""
+    device = create_encrypted_device()
+    device._iv = b"\x12\x34\x56\x78\x9a\xbc\xde\xf0\x12\x34\x56\x78\x9a\xbc\xde\xf0"
+    device._encryption_mode = AESMode.CTR
+
+    with patch.object(device, "_send_command_locked_with_retry") as mock_send:
+        mock_send.return_value = b"\x01\x00\x00\x00"
+
+        await device._send_command("570f430101")
+        await device._send_command(bytes.fromhex("570f430101"))
+
+        hex_call, bytes_call = mock_send.call_args_list
+        assert bytes(hex_call[0][1]) == bytes(bytes_call[0][1])
+
+
 @pytest.mark.asyncio
 async def test_iv_race_condition_during_disconnect() -> None:
     """Test that commands during disconnect are handled properly."""
@@ -178,7 +206,7 @@ async def test_iv_race_condition_during_disconnect() -> None:
         patch.object(device, "_encrypt") as mock_encrypt,
         patch.object(device, "_decrypt") as mock_decrypt,
     ):
-        mock_encrypt.return_value = ("656e63727970746564", "abcd")
+        mock_encrypt.return_value = (b"encrypted", b"\xab\xcd")
         mock_decrypt.return_value = b"response"
         mock_send.return_value = b"\x01\x00\x00\x00response"
 
@@ -287,7 +315,7 @@ async def test_device_with_gcm_mode() -> None:
         patch.object(device, "_increment_gcm_iv") as mock_inc_iv,
     ):
         mock_ensure.return_value = True
-        mock_encrypt.return_value = ("10203040", "abcd")
+        mock_encrypt.return_value = (b"\x10\x20\x30\x40", b"\xab\xcd")
         mock_send.return_value = b"\x01\x00\x00\x00\x10\x20\x30\x40"
         mock_decrypt.return_value = b"\x10\x20\x30\x40"
 
@@ -371,10 +399,10 @@ async def test_gcm_encrypt_decrypt_without_finalize() -> None:
     device._encryption_mode = AESMode.GCM
     device._iv = b"\x10" * 12
 
-    ciphertext_hex, _ = device._encrypt("48656c6c6f")
-    decrypted = device._decrypt(bytearray.fromhex(ciphertext_hex))
+    ciphertext, _ = device._encrypt(b"Hello")
+    decrypted = device._decrypt(bytearray(ciphertext))
 
-    assert decrypted.hex() == "48656c6c6f"
+    assert decrypted == b"Hello"
 
 
 @pytest.mark.asyncio
@@ -400,14 +428,34 @@ async def test_encrypt_decrypt_with_valid_iv() -> None:
     device._iv = b"\x00" * 16  # Use zeros for predictable test
 
     # Test encryption
-    ciphertext_hex, header_hex = device._encrypt("48656c6c6f")  # "Hello" in hex
-    assert isinstance(ciphertext_hex, str)
-    assert isinstance(header_hex, str)
-    assert len(ciphertext_hex) > 0
+    ciphertext, header = device._encrypt(b"Hello")
+    assert isinstance(ciphertext, bytes)
+    assert header == device._iv[:2]
+    assert len(ciphertext) == 5
 
     # Test decryption
-    decrypted = device._decrypt(bytearray.fromhex(ciphertext_hex))
-    assert decrypted.hex() == "48656c6c6f"
+    decrypted = device._decrypt(bytearray(ciphertext))
+    assert decrypted == b"Hello"
+
+
+@pytest.mark.asyncio
+async def test_ctr_encrypt_decrypt_match_fresh_cipher() -> None:
+    """Cached CTR keystream output matches a cipher started at the IV each time."""
+    device = create_encrypted_device()
+    iv = bytes(range(16))
+    device._iv = iv
+    device._encryption_mode = AESMode.CTR
+    cipher = Cipher(algorithms.AES128(device._encryption_key), modes.CTR(iv))
+
+    for plaintext in (b"\x01", b"\x0f\x43\x01", bytes(80), b"\x0f\x43\x01"):
+        expected = cipher.encryptor().update(plaintext)
+        assert device._encrypt(plaintext) == (expected, iv[:2])
+        assert device._decrypt(bytearray(expected)) == plaintext
+
+    device._iv = bytes(16)
+    device._cipher = None
+    fresh = Cipher(algorithms.AES128(device._encryption_key), modes.CTR(bytes(16)))
+    assert device._encrypt(b"\x01")[0] == fresh.encryptor().update(b"\x01")
 
 
 @pytest.mark.asyncio
@@ -417,7 +465,7 @@ async def test_encrypt_with_none_iv() -> None:
     device._iv = None
 
     with pytest.raises(RuntimeError, match="Cannot encrypt: IV is None"):
-        device._encrypt("48656c6c6f")
+        device._encrypt(b"Hello")
 
 
 @pytest.mark.asyncio
@@ -474,7 +522,7 @@ async def test_concurrent_commands_with_same_device() -> None:
         patch.object(device, "_encrypt") as mock_encrypt,
         patch.object(device, "_decrypt") as mock_decrypt,
     ):
-        mock_encrypt.return_value = ("656e63727970746564", "abcd")
+        mock_encrypt.return_value = (b"encrypted", b"\xab\xcd")
         mock_decrypt.return_value = b"response"
         mock_send.return_value = b"\x01\x00\x00\x00data"
 
@@ -507,7 +555,7 @@ async def test_command_retry_with_encryption() -> None:
         patch.object(device, "_encrypt") as mock_encrypt,
         patch.object(device, "_decrypt") as mock_decrypt,
     ):
-        mock_encrypt.return_value = ("656e63727970746564", "abcd")
+        mock_encrypt.return_value = (b"encrypted", b"\xab\xcd")
         mock_decrypt.return_value = b"response"
 
         # First attempt fails, second succeeds
@@ -528,9 +576,9 @@ async def test_empty_data_encryption_decryption() -> None:
     device = create_encrypted_device()
     device._iv = b"\x00" * 16
 
-    # Test empty encryption
-    encrypted = device._encrypt("")
-    assert encrypted == ("", "")
+    # Test empty encryption; every command carries a payload, so there is no
+    # special case and the IV header is still produced
+    assert device._encrypt(b"") == (b"", b"\x00\x00")
 
     # Test empty decryption
     decrypted = device._decrypt(bytearray())
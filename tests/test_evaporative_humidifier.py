@@ -11,6 +11,7 @@ from switchbot import (
     SwitchBotAdvertisement,
     SwitchbotModel,
 )
+from switchbot.adv_parsers.humidifier import process_evaporative_humidifier
 from switchbot.devices import evaporative_humidifier
 from switchbot.devices.device import SwitchbotOperationError
 
@@ -163,6 +164,28 @@ async def test_get_basic_info(basic_info, result):
     assert info["target_humidity"] == result[14]
 
 
+@pytest.mark.asyncio
+async def test_get_basic_info_unknown_mode():
+    """Test that an unknown mode value raises ValueError."""
+    device = create_device_for_command_testing()
+    device._get_basic_info = AsyncMock(
+        return_value=bytearray(
+            b"\x01\x80\x88\xb1\x98\x82\x00\x1e\x00\x88-\xc4\xff\xff \n\x07"
+        )
+    )
+
+    with pytest.raises(ValueError, match="is not a valid HumidifierMode"):
+        await device.get_basic_info()
+
+
+def test_process_adv_unknown_mode():
+    """Test that an unknown mode value in the advertisement raises ValueError."""
+    mfr_data = bytes(7) + b"\x80" + bytes(9)
+
+    with pytest.raises(ValueError, match="is not a valid HumidifierMode"):
+        process_evaporative_humidifier(None, mfr_data)
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("err_msg", "mode", "water_level"),
@@ -234,17 +257,17 @@ async def test_set_target_humidity():
     device.get_mode = MagicMock(return_value=HumidifierMode.TARGET_HUMIDITY)
 
     await device.set_target_humidity(45)
-    device._send_command.assert_awaited_once_with("570f430202002d")
+    device._send_command.assert_awaited_once_with(bytes.fromhex("570f430202002d"))
 
 
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("mode", "command"),
     [
-        (HumidifierMode.TARGET_HUMIDITY, "570f430202002d"),
-        (HumidifierMode.AUTO, "570f4302040000"),
-        (HumidifierMode.SLEEP, "570f430203002d"),
-        (HumidifierMode.DRYING_FILTER, "570f43010108"),
+        (HumidifierMode.TARGET_HUMIDITY, bytes.fromhex("570f430202002d")),
+        (HumidifierMode.AUTO, bytes.fromhex("570f4302040000")),
+        (HumidifierMode.SLEEP, bytes.fromhex("570f430203002d")),
+        (HumidifierMode.DRYING_FILTER, bytes.fromhex("570f43010108")),
     ],
 )
 async def test_set_mode(mode, command):
@@ -300,8 +323,8 @@ async def test_status_from_process_adv(init_data, result):
 @pytest.mark.parametrize(
     ("enabled", "command"),
     [
-        (True, "570f430501"),
-        (False, "570f430500"),
+        (True, bytes.fromhex("570f430501")),
+        (False, bytes.fromhex("570f430500")),
     ],
 )
 async def test_set_child_lock(enabled, command):
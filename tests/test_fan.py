@@ -132,6 +132,24 @@ async def test_get_basic_info(basic_info, firmware_info, result):
     assert info["firmware"] == result[5]
 
 
+@pytest.mark.parametrize(
+    ("mode_byte", "fan_mode", "standing_fan_mode"),
+    [
+        (0x00, None, None),
+        (0x04, "baby", "baby"),
+        (0x05, None, "custom_natural"),
+        (0x06, None, None),
+    ],
+)
+def test_parse_basic_info_mode(mode_byte, fan_mode, standing_fan_mode):
+    data = bytes((0x01, 0x02, 0x57, 0x82, 0x00, 0x00, 0x00, 0x00, mode_byte, 0x3D))
+    firmware = b"\x01\x57\x0b"
+    fan_info = create_device_for_command_testing()._parse_basic_info(data, firmware)
+    standing_info = create_standing_fan_for_testing()._parse_basic_info(data, firmware)
+    assert fan_info["mode"] == fan_mode
+    assert standing_info["mode"] == standing_fan_mode
+
+
 @pytest.mark.asyncio
 async def test_set_preset_mode():
     fan_device = create_device_for_command_testing({"mode": "baby"})
@@ -152,6 +170,22 @@ async def test_set_percentage():
     fan_device = create_device_for_command_testing({"speed": 80})
     await fan_device.set_percentage(80)
     assert fan_device.get_current_percentage() == 80
+    fan_device._send_command.assert_awaited_once_with(bytes.fromhex("570f41030250"))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("preset_mode", [FanMode.BABY, "baby"])
+async def test_set_preset_mode_accepts_enum_or_name(preset_mode):
+    fan_device = create_device_for_command_testing()
+    await fan_device.set_preset_mode(preset_mode)
+    fan_device._send_command.assert_awaited_once_with(bytes.fromhex("570f41030104"))
+
+
+def test_public_mode_command_tables_keyed_by_name():
+    """Test the public mode tables map each mode name to its hex command once."""
+    assert list(fan.COMMAND_SET_MODE) == FanMode.get_modes()
+    assert list(fan.COMMAND_SET_STANDING_FAN_MODE) == StandingFanMode.get_modes()
+    assert fan.COMMAND_SET_MODE["baby"] == "570f41030104"
 
 
 @pytest.mark.asyncio
@@ -491,7 +525,9 @@ async def test_standing_fan_set_horizontal_oscillation_angle(angle):
     await standing_fan.set_horizontal_oscillation_angle(angle)
     standing_fan._send_command.assert_called_once()
     cmd = standing_fan._send_command.call_args[0][0]
-    assert cmd == f"{fan.COMMAND_SET_OSCILLATION_PARAMS}{angle.value:02X}FFFFFF"
+    assert cmd == fan.COMMAND_SET_OSCILLATION_PARAMS + bytes(
+        (angle.value, 0xFF, 0xFF, 0xFF)
+    )
 
 
 @pytest.mark.asyncio
@@ -501,7 +537,7 @@ async def test_standing_fan_set_horizontal_oscillation_angle_int(angle):
     standing_fan = create_standing_fan_for_testing()
     await standing_fan.set_horizontal_oscillation_angle(angle)
     cmd = standing_fan._send_command.call_args[0][0]
-    assert cmd == f"{fan.COMMAND_SET_OSCILLATION_PARAMS}{angle:02X}FFFFFF"
+    assert cmd == fan.COMMAND_SET_OSCILLATION_PARAMS + bytes((angle, 0xFF, 0xFF, 0xFF))
 
 
 @pytest.mark.asyncio
@@ -528,7 +564,9 @@ async def test_standing_fan_set_vertical_oscillation_angle(angle):
     await standing_fan.set_vertical_oscillation_angle(angle)
     standing_fan._send_command.assert_called_once()
     cmd = standing_fan._send_command.call_args[0][0]
-    assert cmd == f"{fan.COMMAND_SET_OSCILLATION_PARAMS}FFFF{angle.value:02X}FF"
+    assert cmd == fan.COMMAND_SET_OSCILLATION_PARAMS + bytes(
+        (0xFF, 0xFF, angle.value, 0xFF)
+    )
 
 
 @pytest.mark.asyncio
@@ -538,7 +576,9 @@ async def test_standing_fan_set_vertical_oscillation_angle_int(byte_value):
     standing_fan = create_standing_fan_for_testing()
     await standing_fan.set_vertical_oscillation_angle(byte_value)
     cmd = standing_fan._send_command.call_args[0][0]
-    assert cmd == f"{fan.COMMAND_SET_OSCILLATION_PARAMS}FFFF{byte_value:02X}FF"
+    assert cmd == fan.COMMAND_SET_OSCILLATION_PARAMS + bytes(
+        (0xFF, 0xFF, byte_value, 0xFF)
+    )
 
 
 @pytest.mark.asyncio
@@ -560,7 +600,7 @@ async def test_standing_fan_set_night_light(state):
     await standing_fan.set_night_light(state)
     standing_fan._send_command.assert_called_once()
     cmd = standing_fan._send_command.call_args[0][0]
-    assert cmd == f"{fan.COMMAND_SET_NIGHT_LIGHT}{state.value:02X}FFFF"
+    assert cmd == fan.COMMAND_SET_NIGHT_LIGHT + bytes((state.value, 0xFF, 0xFF))
 
 
 @pytest.mark.asyncio
@@ -570,7 +610,7 @@ async def test_standing_fan_set_night_light_int(state):
     standing_fan = create_standing_fan_for_testing()
     await standing_fan.set_night_light(state)
     cmd = standing_fan._send_command.call_args[0][0]
-    assert cmd == f"{fan.COMMAND_SET_NIGHT_LIGHT}{state:02X}FFFF"
+    assert cmd == fan.COMMAND_SET_NIGHT_LIGHT + bytes((state, 0xFF, 0xFF))
 
 
 @pytest.mark.asyncio
@@ -668,14 +708,14 @@ async def test_standing_fan_get_basic_info_extended():
 @pytest.mark.parametrize(
     ("invoke", "expected_cmd"),
     [
-        (lambda d: d.set_child_lock(True), f"{fan.COMMAND_SET_CHILD_LOCK}01"),
-        (lambda d: d.set_child_lock(False), f"{fan.COMMAND_SET_CHILD_LOCK}02"),
-        (lambda d: d.set_display(True), f"{fan.COMMAND_SET_DISPLAY_LIGHT}01FFFF"),
-        (lambda d: d.set_display(False), f"{fan.COMMAND_SET_DISPLAY_LIGHT}02FFFF"),
-        (lambda d: d.set_sound(True), f"{fan.COMMAND_SET_SOUND}64"),
-        (lambda d: d.set_sound(False), f"{fan.COMMAND_SET_SOUND}00"),
-        (lambda d: d.set_auto_recenter(True), f"{fan.COMMAND_SET_AUTO_RECENTER}0101"),
-        (lambda d: d.set_auto_recenter(False), f"{fan.COMMAND_SET_AUTO_RECENTER}0202"),
+        (lambda d: d.set_child_lock(True), bytes.fromhex("570f410701")),
+        (lambda d: d.set_child_lock(False), bytes.fromhex("570f410702")),
+        (lambda d: d.set_display(True), bytes.fromhex("570f41050101ffff")),
+        (lambda d: d.set_display(False), bytes.fromhex("570f41050102ffff")),
+        (lambda d: d.set_sound(True), bytes.fromhex("570f41060164")),
+        (lambda d: d.set_sound(False), bytes.fromhex("570f41060100")),
+        (lambda d: d.set_auto_recenter(True), bytes.fromhex("570f4102050101")),
+        (lambda d: d.set_auto_recenter(False), bytes.fromhex("570f4102050202")),
     ],
 )
 async def test_standing_fan_extra_setter_commands(invoke, expected_cmd):
@@ -2,7 +2,7 @@
 
 import pytest
 
-from switchbot.helpers import parse_power_data
+from switchbot.helpers import parse_power_data, parse_uint24_be
 
 
 def test_parse_power_data_basic():
@@ -70,3 +70,22 @@ def test_parse_power_data_real_world_examples():
 
     # Power at offset 13-14: 0x00E8 = 232 / 10.0 = 23.2W
     assert parse_power_data(raw_data, 13, 10.0) == 23.2
+
+
+def test_parse_uint24_be():
+    """Test 3-byte big-endian parsing."""
+    data = b"\x00\x12\x34\x56\xff\xff\xff"
+
+    assert parse_uint24_be(data, 1) == 0x123456
+    assert parse_uint24_be(data, 4) == 0xFFFFFF
+    assert parse_uint24_be(data, 0) == 0x001234
+
+
+def test_parse_uint24_be_insufficient_data():
+    """Test error handling for insufficient data."""
+    with pytest.raises(ValueError, match="Insufficient data"):
+        parse_uint24_be(b"\x12\x34", 0)
+
+    # Would need to read bytes 2-4
+    with pytest.raises(ValueError, match="Insufficient data"):
+        parse_uint24_be(b"\x12\x34\x56\x78", 2)
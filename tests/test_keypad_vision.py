@@ -123,7 +123,16 @@ async def test_add_invalid_password(adv_info: AdvTestCase) -> None:
     """Test adding an invalid password raises ValueError."""
     device = create_device_for_command_testing(adv_info)
 
-    invalid_passwords = ["123", "abcdef", "1234567890123", "12 3456", "passw0rd!"]
+    invalid_passwords = [
+        "123",
+        "abcdef",
+        "1234567890123",
+        "12 3456",
+        "passw0rd!",
+        "123456\n",
+        "١٢٣٤٥٦",
+        "12345²",
+    ]
 
     for password in invalid_passwords:
         with pytest.raises(ValueError, match=r"Password must be 6-12 digits."):
@@ -143,16 +152,19 @@ async def test_add_invalid_password(adv_info: AdvTestCase) -> None:
     [
         (
             "123456",
-            ["570F52020210FF0006010203040506"],
+            [bytes.fromhex("570F52020210FF0006010203040506")],
         ),
         (
             "123456789012",
-            ["570F52020220FF000C0102030405060708", "570F5202022109000102"],
+            [
+                bytes.fromhex("570F52020220FF000C0102030405060708"),
+                bytes.fromhex("570F5202022109000102"),
+            ],
         ),
     ],
 )
 async def test_add_password(
-    adv_info: AdvTestCase, password: str, expected_payload: list[str]
+    adv_info: AdvTestCase, password: str, expected_payload: list[bytes]
 ) -> None:
     """Test adding a valid password sends correct command."""
     device = create_device_for_command_testing(adv_info)
@@ -257,3 +269,51 @@ async def test_verify_encryption_key(
     )
 
     assert result is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "adv_info",
+    [
+        KEYPAD_VISION_INFO,
+        KEYPAD_VISION_PRO_INFO,
+    ],
+)
+@patch.object(SwitchbotEncryptedDevice, "verify_encryption_key", new_callable=AsyncMock)
+async def test_verify_encryption_key_positional_model(
+    mock_parent_verify: AsyncMock, adv_info: AdvTestCase
+):
+    ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    key_id = "ff"
+    encryption_key = "ffffffffffffffffffffffffffffffff"
+
+    mock_parent_verify.return_value = True
+
+    result = await SwitchbotKeypadVision.verify_encryption_key(
+        ble_device, key_id, encryption_key, adv_info.modelName
+    )
+
+    mock_parent_verify.assert_awaited_once_with(
+        ble_device,
+        key_id,
+        encryption_key,
+        adv_info.modelName,
+    )
+
+    assert result is True
+
+
+@pytest.mark.parametrize(
+    "adv_info",
+    [
+        KEYPAD_VISION_INFO,
+        KEYPAD_VISION_PRO_INFO,
+    ],
+)
+def test_init_with_positional_model(adv_info: AdvTestCase):
+    ble_device = generate_ble_device("aa:bb:cc:dd:ee:ff", "any")
+    device = SwitchbotKeypadVision(
+        ble_device, "ff", "ffffffffffffffffffffffffffffffff", adv_info.modelName
+    )
+
+    assert device._model == adv_info.modelName
@@ -1,3 +1,4 @@
+from datetime import datetime
 from unittest.mock import AsyncMock
 
 import pytest
@@ -32,7 +33,7 @@ async def test_get_time_offset(device_response: str, expected_offset: int):
     device._send_command.return_value = bytes.fromhex(device_response)
 
     offset = await device.get_time_offset()
-    device._send_command.assert_called_with("570f690506")
+    device._send_command.assert_called_with(bytes.fromhex("570f690506"))
     assert offset == expected_offset
 
 
@@ -44,7 +45,7 @@ async def test_get_time_offset_failure():
 
     with pytest.raises(SwitchbotOperationError):
         await device.get_time_offset()
-    device._send_command.assert_called_with("570f690506")
+    device._send_command.assert_called_with(bytes.fromhex("570f690506"))
 
 
 @pytest.mark.asyncio
@@ -68,6 +69,8 @@ async def test_get_time_offset_wrong_response():
         (-4096, "80001000"),  # "80" for negative offset, 001000 for 4096
         (0, "00000000"),
         (-0, "00000000"),  # -0 == 0 in Python
+        (MAX_TIME_OFFSET, "00ffffff"),
+        (-MAX_TIME_OFFSET, "80ffffff"),
     ],
 )
 async def test_set_time_offset(offset_sec: int, expected_payload: str):
@@ -75,7 +78,9 @@ async def test_set_time_offset(offset_sec: int, expected_payload: str):
     device._send_command.return_value = bytes.fromhex("01")
 
     await device.set_time_offset(offset_sec)
-    device._send_command.assert_called_with("570f680506" + expected_payload)
+    device._send_command.assert_called_with(
+        bytes.fromhex("570f680506" + expected_payload)
+    )
 
 
 @pytest.mark.asyncio
@@ -114,7 +119,7 @@ async def test_get_datetime_success():
     device._send_command.return_value = bytes.fromhex(response_hex)
 
     result = await device.get_datetime()
-    device._send_command.assert_called_with("570f6901")
+    device._send_command.assert_called_with(bytes.fromhex("570f6901"))
 
     assert result["12h_mode"] is False
     assert result["year"] == 2025
@@ -134,7 +139,7 @@ async def test_get_datetime_12h_mode():
     device._send_command.return_value = bytes.fromhex(response_hex)
 
     result = await device.get_datetime()
-    device._send_command.assert_called_with("570f6901")
+    device._send_command.assert_called_with(bytes.fromhex("570f6901"))
 
     assert result["12h_mode"] is True
     assert result["year"] == 0
@@ -145,6 +150,27 @@ async def test_get_datetime_12h_mode():
     assert result["second"] == 0
 
 
+@pytest.mark.asyncio
+async def test_get_datetime_as_datetime():
+    device = create_device()
+    device._send_command.return_value = bytes.fromhex("01e40294238007e90c1e083701")
+
+    is_12h_mode, value = await device.get_datetime_as_datetime()
+    device._send_command.assert_called_with(bytes.fromhex("570f6901"))
+
+    assert is_12h_mode is True
+    assert value == datetime(2025, 12, 30, 8, 55, 1)  # noqa: DTZ001
+
+
+@pytest.mark.asyncio
+async def test_get_datetime_as_datetime_unset_clock():
+    device = create_device()
+    device._send_command.return_value = bytes.fromhex("010000000080000001010c0000")
+
+    with pytest.raises(SwitchbotOperationError, match="invalid datetime"):
+        await device.get_datetime_as_datetime()
+
+
 @pytest.mark.asyncio
 async def test_get_datetime_failure():
     device = create_device()
@@ -199,7 +225,7 @@ async def test_set_datetime(  # noqa: PLR0913
 
     expected_ts = expected_ts.zfill(16)
     expected_payload = "57000503" + expected_utc + expected_ts + expected_min
-    device._send_command.assert_called_with(expected_payload)
+    device._send_command.assert_called_with(bytes.fromhex(expected_payload))
 
 
 @pytest.mark.asyncio
@@ -209,8 +235,9 @@ async def test_set_datetime(  # noqa: PLR0913
 )
 async def test_set_datetime_invalid_utc_offset_hours(bad_hour: int):
     device = create_device()
-    with pytest.raises(SwitchbotOperationError):
+    with pytest.raises(SwitchbotOperationError, match="utc_offset_hours"):
         await device.set_datetime(1709251200, utc_offset_hours=bad_hour)
+    device._send_command.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -220,8 +247,9 @@ async def test_set_datetime_invalid_utc_offset_hours(bad_hour: int):
 )
 async def test_set_datetime_invalid_utc_offset_minutes(bad_min: int):
     device = create_device()
-    with pytest.raises(SwitchbotOperationError):
+    with pytest.raises(SwitchbotOperationError, match="utc_offset_minutes"):
         await device.set_datetime(1709251200, utc_offset_minutes=bad_min)
+    device._send_command.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -237,7 +265,9 @@ async def test_set_time_display_format(is_12h_mode: bool, expected_payload: str)
     device._send_command.return_value = bytes.fromhex("01")
 
     await device.set_time_display_format(is_12h_mode=is_12h_mode)
-    device._send_command.assert_called_with("570f680505" + expected_payload)
+    device._send_command.assert_called_with(
+        bytes.fromhex("570f680505" + expected_payload)
+    )
 
 
 @pytest.mark.asyncio
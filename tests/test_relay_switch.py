@@ -224,16 +224,20 @@ async def test_get_basic_info_2PM(common_parametrize_2pm, info_data, result):
 
     assert device.channel == 2
 
-    device.get_current_time_and_start_time = MagicMock(
-        return_value=("683074d6", "682fba80")
+    device._current_time_and_start_time = MagicMock(
+        return_value=(0x683074D6, 0x682FBA80)
     )
 
     async def mock_get_basic_info(arg):
         if arg == relay_switch.COMMAND_GET_BASIC_INFO:
             return info_data["basic_info"]
-        if arg == relay_switch.COMMAND_GET_CHANNEL1_INFO.format("683074d6", "682fba80"):
+        if arg == relay_switch.COMMAND_GET_CHANNEL1_INFO + bytes.fromhex(
+            "683074d6682fba80"
+        ):
             return info_data["channel1_info"]
-        if arg == relay_switch.COMMAND_GET_CHANNEL2_INFO.format("683074d6", "682fba80"):
+        if arg == relay_switch.COMMAND_GET_CHANNEL2_INFO + bytes.fromhex(
+            "683074d6682fba80"
+        ):
             return info_data["channel2_info"]
         return None
 
@@ -285,16 +289,20 @@ async def test_basic_info_exceptions_2PM(common_parametrize_2pm, info_data):
         common_parametrize_2pm["rawAdvData"], common_parametrize_2pm["model"]
     )
 
-    device.get_current_time_and_start_time = MagicMock(
-        return_value=("683074d6", "682fba80")
+    device._current_time_and_start_time = MagicMock(
+        return_value=(0x683074D6, 0x682FBA80)
     )
 
     async def mock_get_basic_info(arg):
         if arg == relay_switch.COMMAND_GET_BASIC_INFO:
             return info_data["basic_info"]
-        if arg == relay_switch.COMMAND_GET_CHANNEL1_INFO.format("683074d6", "682fba80"):
+        if arg == relay_switch.COMMAND_GET_CHANNEL1_INFO + bytes.fromhex(
+            "683074d6682fba80"
+        ):
             return info_data["channel1_info"]
-        if arg == relay_switch.COMMAND_GET_CHANNEL2_INFO.format("683074d6", "682fba80"):
+        if arg == relay_switch.COMMAND_GET_CHANNEL2_INFO + bytes.fromhex(
+            "683074d6682fba80"
+        ):
             return info_data["channel2_info"]
         return None
 
@@ -352,16 +360,20 @@ async def test_get_basic_info_2PM_short_response(common_parametrize_2pm, info_da
         common_parametrize_2pm["rawAdvData"], common_parametrize_2pm["model"]
     )
 
-    device.get_current_time_and_start_time = MagicMock(
-        return_value=("683074d6", "682fba80")
+    device._current_time_and_start_time = MagicMock(
+        return_value=(0x683074D6, 0x682FBA80)
     )
 
     async def mock_get_basic_info(arg):
         if arg == relay_switch.COMMAND_GET_BASIC_INFO:
             return info_data["basic_info"]
-        if arg == relay_switch.COMMAND_GET_CHANNEL1_INFO.format("683074d6", "682fba80"):
+        if arg == relay_switch.COMMAND_GET_CHANNEL1_INFO + bytes.fromhex(
+            "683074d6682fba80"
+        ):
             return info_data["channel1_info"]
-        if arg == relay_switch.COMMAND_GET_CHANNEL2_INFO.format("683074d6", "682fba80"):
+        if arg == relay_switch.COMMAND_GET_CHANNEL2_INFO + bytes.fromhex(
+            "683074d6682fba80"
+        ):
             return info_data["channel2_info"]
         return None
 
@@ -393,14 +405,16 @@ async def test_get_basic_info_2PM_short_response(common_parametrize_2pm, info_da
 async def test_get_basic_info_short_response(rawAdvData, model, info_data):
     """Truncated BLE responses on single-channel relay/garage/plug must yield None."""
     device = create_device_for_command_testing(rawAdvData, model)
-    device.get_current_time_and_start_time = MagicMock(
-        return_value=("683074d6", "682fba80")
+    device._current_time_and_start_time = MagicMock(
+        return_value=(0x683074D6, 0x682FBA80)
     )
 
     async def mock_get_basic_info(arg):
         if arg == relay_switch.COMMAND_GET_BASIC_INFO:
             return info_data["basic_info"]
-        if arg == relay_switch.COMMAND_GET_CHANNEL1_INFO.format("683074d6", "682fba80"):
+        if arg == relay_switch.COMMAND_GET_CHANNEL1_INFO + bytes.fromhex(
+            "683074d6682fba80"
+        ):
             return info_data["channel1_info"]
         return None
 
@@ -481,14 +495,16 @@ async def test_toggle(rawAdvData, model):
 async def test_get_basic_info_garage_door_opener(rawAdvData, model, info_data):
     """Test get_basic_info for garage door opener."""
     device = create_device_for_command_testing(rawAdvData, model)
-    device.get_current_time_and_start_time = MagicMock(
-        return_value=("683074d6", "682fba80")
+    device._current_time_and_start_time = MagicMock(
+        return_value=(0x683074D6, 0x682FBA80)
     )
 
     async def mock_get_basic_info(arg):
         if arg == relay_switch.COMMAND_GET_BASIC_INFO:
             return info_data["basic_info"]
-        if arg == relay_switch.COMMAND_GET_CHANNEL1_INFO.format("683074d6", "682fba80"):
+        if arg == relay_switch.COMMAND_GET_CHANNEL1_INFO + bytes.fromhex(
+            "683074d6682fba80"
+        ):
             return info_data["channel1_info"]
         return None
 
@@ -497,6 +513,8 @@ async def test_get_basic_info_garage_door_opener(rawAdvData, model, info_data):
     assert info is not None
     assert info["isOn"] is True
     assert info["door_open"] is True
+    assert "energy" not in info
+    assert "use_time" not in info
 
 
 @pytest.mark.parametrize(
@@ -586,3 +604,33 @@ async def test_press():
     )
     await device.press()
     device._send_command.assert_awaited_once_with(device._press_command)
+
+
+@pytest.mark.asyncio
+async def test_get_current_time_and_start_time(monkeypatch):
+    """Test the time fields sent with the channel info commands."""
+    device = create_device_for_command_testing(
+        b"<\x00\x00\x00", SwitchbotModel.RELAY_SWITCH_1PM
+    )
+    monkeypatch.setattr(relay_switch.time, "time", lambda: 1748006102.7)
+
+    assert device._current_time_and_start_time() == (0x683074D6, 0x682FBA80)
+    assert device.get_current_time_and_start_time() == ("683074d6", "682fba80")
+
+
+@pytest.mark.asyncio
+async def test_parse_user_data_floors_small_readings():
+    """Test that tiny non-zero readings are floored instead of rounded to 0."""
+    device = create_device_for_command_testing(
+        b"<\x00\x00\x00", SwitchbotModel.RELAY_SWITCH_1PM
+    )
+    raw_data = bytes.fromhex("00000001000000005a000100320000")
+
+    assert device._parse_user_data(raw_data) == {
+        "energy": 0.01,
+        "energy usage yesterday": 0,
+        "use_time": 1.5,
+        "voltage": 0.1,
+        "current": 0.1,
+        "power": 0,
+    }
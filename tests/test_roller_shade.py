@@ -58,7 +58,7 @@ async def test_open():
     assert roller_shade_device.is_opening() is True
     assert roller_shade_device.is_closing() is False
     roller_shade_device._send_multiple_commands.assert_awaited_once_with(
-        [roller_shade.OPEN_KEYS[0], f"{roller_shade.OPEN_KEYS[1]}0000"]
+        [roller_shade.OPEN_KEYS[0], roller_shade.OPEN_KEYS[1] + bytes.fromhex("0000")]
     )
 
 
@@ -69,7 +69,7 @@ async def test_open_quietdrift():
     assert roller_shade_device.is_opening() is True
     assert roller_shade_device.is_closing() is False
     roller_shade_device._send_multiple_commands.assert_awaited_once_with(
-        [roller_shade.OPEN_KEYS[0], f"{roller_shade.OPEN_KEYS[1]}0100"]
+        [roller_shade.OPEN_KEYS[0], roller_shade.OPEN_KEYS[1] + bytes.fromhex("0100")]
     )
 
 
@@ -80,7 +80,7 @@ async def test_close():
     assert roller_shade_device.is_opening() is False
     assert roller_shade_device.is_closing() is True
     roller_shade_device._send_multiple_commands.assert_awaited_once_with(
-        [roller_shade.CLOSE_KEYS[0], f"{roller_shade.CLOSE_KEYS[1]}0064"]
+        [roller_shade.CLOSE_KEYS[0], roller_shade.CLOSE_KEYS[1] + bytes.fromhex("0064")]
     )
 
 
@@ -91,7 +91,7 @@ async def test_close_quietdrift():
     assert roller_shade_device.is_opening() is False
     assert roller_shade_device.is_closing() is True
     roller_shade_device._send_multiple_commands.assert_awaited_once_with(
-        [roller_shade.CLOSE_KEYS[0], f"{roller_shade.CLOSE_KEYS[1]}0164"]
+        [roller_shade.CLOSE_KEYS[0], roller_shade.CLOSE_KEYS[1] + bytes.fromhex("0164")]
     )
 
 
@@ -233,8 +233,8 @@ async def test_set_position_default_mode_performance():
     await curtain_device.set_position(50)
     curtain_device._send_multiple_commands.assert_awaited_once_with(
         [
-            f"{roller_shade.POSITION_KEYS[0]}32",
-            f"{roller_shade.POSITION_KEYS[1]}0032",
+            roller_shade.POSITION_KEYS[0] + bytes.fromhex("32"),
+            roller_shade.POSITION_KEYS[1] + bytes.fromhex("0032"),
         ]
     )
 
@@ -246,8 +246,8 @@ async def test_set_position_quietdrift():
     await curtain_device.set_position(50, mode=1)
     curtain_device._send_multiple_commands.assert_awaited_once_with(
         [
-            f"{roller_shade.POSITION_KEYS[0]}32",
-            f"{roller_shade.POSITION_KEYS[1]}0132",
+            roller_shade.POSITION_KEYS[0] + bytes.fromhex("32"),
+            roller_shade.POSITION_KEYS[1] + bytes.fromhex("0132"),
         ]
     )
 
@@ -260,8 +260,8 @@ async def test_set_position_quietdrift_reversed():
     await curtain_device.set_position(30, mode=1)
     curtain_device._send_multiple_commands.assert_awaited_once_with(
         [
-            f"{roller_shade.POSITION_KEYS[0]}46",
-            f"{roller_shade.POSITION_KEYS[1]}0146",
+            roller_shade.POSITION_KEYS[0] + bytes.fromhex("46"),
+            roller_shade.POSITION_KEYS[1] + bytes.fromhex("0146"),
         ]
     )
 
@@ -308,7 +308,7 @@ async def test_close_speed_kwarg_is_deprecated_alias_for_mode():
     with pytest.warns(DeprecationWarning, match="speed.*deprecated"):
         await roller_shade_device.close(speed=1)
     roller_shade_device._send_multiple_commands.assert_awaited_once_with(
-        [roller_shade.CLOSE_KEYS[0], f"{roller_shade.CLOSE_KEYS[1]}0164"]
+        [roller_shade.CLOSE_KEYS[0], roller_shade.CLOSE_KEYS[1] + bytes.fromhex("0164")]
     )
 
 
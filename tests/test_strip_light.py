@@ -310,7 +310,9 @@ async def test_set_rgb(device_case):
 
     await device.set_rgb(100, 255, 128, 64)
 
-    device._send_command.assert_called_with(device._set_rgb_command.format("64FF8040"))
+    device._send_command.assert_called_with(
+        bytes.fromhex(device._set_rgb_command.format("64FF8040"))
+    )
 
 
 @pytest.mark.asyncio
@@ -464,6 +466,22 @@ async def test_exception_with_wrong_model():
         await device.set_rgb(100, 255, 128, 64)
 
 
+@pytest.mark.asyncio
+async def test_color_mode_follows_latest_advertisement():
+    """color_mode is read from the current advertisement, never a stale copy."""
+    device = create_device_for_command_testing(
+        STRIP_LIGHT_3_INFO, light_strip.SwitchbotStripLight3, {"color_mode": 2}
+    )
+    assert device.color_mode == ColorMode.RGB
+
+    device.update_from_advertisement(
+        make_advertisement_data(
+            device._device, STRIP_LIGHT_3_INFO, {"color_mode": 6, "sequence_number": 9}
+        )
+    )
+    assert device.color_mode == ColorMode.COLOR_TEMP
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("color_mode_value", "expected_color_mode"),
@@ -476,6 +494,7 @@ async def test_exception_with_wrong_model():
         (6, ColorMode.COLOR_TEMP),
         (7, ColorMode.EFFECT),  # EFFECT (RGBIC-specific)
         (10, ColorMode.OFF),  # UNKNOWN
+        (8, ColorMode.OFF),  # not a known device mode
     ],
 )
 async def test_permanent_outdoor_light_color_mode(